@@ -3,7 +3,7 @@ import logging
 from datetime import timedelta, datetime
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
 from homeassistant.helpers.event import async_track_time_interval
 from .const import DOMAIN
 
@@ -145,18 +145,14 @@ async def async_register_services(hass: HomeAssistant):
             genetic_algo = hass.data[DOMAIN].get('genetic_algorithm')
             if genetic_algo:
                 # Update parameters if provided
-                if 'population_size' in call.data:
-                    genetic_algo.population_size = call.data['population_size']
-                    _LOGGER.info(f"Updated population size to: {call.data['population_size']}")
-                if 'generations' in call.data:
-                    genetic_algo.generations = call.data['generations']
-                    _LOGGER.info(f"Updated generations to: {call.data['generations']}")
-                if 'mutation_rate' in call.data:
-                    genetic_algo.mutation_rate = call.data['mutation_rate']
-                    _LOGGER.info(f"Updated mutation rate to: {call.data['mutation_rate']}")
-                if 'crossover_rate' in call.data:
-                    genetic_algo.crossover_rate = call.data['crossover_rate']
-                    _LOGGER.info(f"Updated crossover rate to: {call.data['crossover_rate']}")
+                parameters = {
+                    key: call.data[key]
+                    for key in ('population_size', 'generations', 'mutation_rate', 'crossover_rate')
+                    if key in call.data
+                }
+                if parameters:
+                    genetic_algo.set_parameters(**parameters)
+                    _LOGGER.info(f"Updated algorithm parameters: {parameters}")
                 
                 # Run optimization
                 _LOGGER.info("Running optimization...")
@@ -204,9 +200,21 @@ async def async_register_services(hass: HomeAssistant):
         except Exception as e:
             _LOGGER.error(f"Error in generate_debug_report service: {e}")
     
+    async def handle_get_control_panel(call: ServiceCall) -> ServiceResponse:
+        """Return the full control panel definition."""
+        control_panel = hass.data[DOMAIN].get('control_panel')
+        if not control_panel:
+            _LOGGER.error("Control panel not available")
+            return {}
+        return control_panel.get_panel_definition()
+    
     # Register services
     hass.services.async_register(DOMAIN, "run_optimization", handle_run_optimization)
     hass.services.async_register(DOMAIN, "debug_optimization", handle_debug_optimization)
     hass.services.async_register(DOMAIN, "generate_debug_report", handle_generate_debug_report)
+    hass.services.async_register(
+        DOMAIN, "get_control_panel", handle_get_control_panel,
+        supports_response=SupportsResponse.ONLY
+    )
     
     _LOGGER.info("Custom services registered successfully")
\ No newline at end of file
@@ -3,6 +3,8 @@ import logging
 import json
 import math
 import random
+import heapq
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 
@@ -16,6 +18,42 @@ from homeassistant.const import CURRENCY_EURO
 _LOGGER = logging.getLogger(__name__)
 from .const import DOMAIN
 
+# Static parts of the chart payloads; only labels and data change per update
+_CHART_TEMPLATES = {
+    "daily_savings_trend": {
+        "type": "line",
+        "dataset": {
+            "label": "Daily Savings (€)",
+            "borderColor": "#4CAF50",
+            "backgroundColor": "rgba(76, 175, 80, 0.1)"
+        }
+    },
+    "hourly_cost_breakdown": {
+        "type": "bar",
+        "dataset": {"label": "Hourly Cost (€)"}
+    },
+    "device_cost_comparison": {
+        "type": "doughnut",
+        "dataset": {"backgroundColor": ["#FF6B6B", "#4ECDC4", "#FFE66D", "#95E1D3"]}
+    },
+    "efficiency_radar": {
+        "type": "radar",
+        "dataset": {
+            "label": "Efficiency %",
+            "borderColor": "#2196F3",
+            "backgroundColor": "rgba(33, 150, 243, 0.2)"
+        }
+    }
+}
+_HOUR_LABELS = tuple(f"{hour:02d}:00" for hour in range(24))
+_PEAK_HOURS = (18, 19, 20, 21)
+_HOURLY_COLORS = tuple("#FF6B6B" if hour in _PEAK_HOURS else "#4ECDC4" for hour in range(24))
+_SOLAR_PROFILE = tuple(
+    max(0, math.sin((hour - 6) * math.pi / 12)) * 2 if 6 <= hour <= 18 else 0
+    for hour in range(24)
+)
+_EFFICIENCY_RADAR_LABELS = ("Solar Utilization", "Load Optimization", "Battery Efficiency", "Overall System")
+
 class CostAnalyticsSensor(SensorEntity):
     """Advanced cost analysis and financial metrics sensor."""
 
@@ -45,6 +83,25 @@ class CostAnalyticsSensor(SensorEntity):
         self._historical_data = []
         self._baseline_data = []
         
+        # Column-oriented mirror of daily_costs (kept in date order) so the
+        # sum/trend math slices flat float lists instead of walking the dicts
+        self._date_col: List[str] = []
+        self._savings_col: List[float] = []
+        self._baseline_col: List[float] = []
+        self._optimized_col: List[float] = []
+        self._trend_stats = self._compute_trend_stats()
+        
+        # Attributes are rebuilt once per update instead of on every state read
+        self._cached_attrs: Dict[str, Any] = {}
+        
+        # The simulated consumption profile only depends on the hour
+        self._hourly_consumption = tuple(self._simulate_hourly_consumption(hour) for hour in range(24))
+        
+        # Clock reading shared by every helper within one update pass
+        self._now = datetime.now()
+        self._today = self._now.date()
+        self._today_iso = self._today.isoformat()
+        
     @property
     def state(self):
         """Return total cost savings today."""
@@ -55,13 +112,17 @@ class CostAnalyticsSensor(SensorEntity):
     @property
     def extra_state_attributes(self):
         """Return comprehensive cost analytics as attributes."""
-        return {
+        return self._cached_attrs
+
+    def _refresh_cached_attributes(self):
+        """Rebuild the attribute payload after the analytics data changed."""
+        self._cached_attrs = {
             "cost_data": self._cost_data,
             "chart_data": self._generate_chart_data(),
             "financial_summary": self._generate_financial_summary(),
             "roi_analysis": self._calculate_roi_analysis(),
             "trend_analysis": self._analyze_trends(),
-            "last_updated": datetime.now().isoformat()
+            "last_updated": self._now.isoformat()
         }
 
     async def async_added_to_hass(self):
@@ -72,32 +133,60 @@ class CostAnalyticsSensor(SensorEntity):
     async def async_update(self, now=None):
         """Update cost analytics with latest data."""
         try:
-            await self._update_daily_costs()
-            await self._update_hourly_breakdown()
-            await self._update_device_costs()
-            await self._update_savings_analysis()
-            await self._update_efficiency_metrics()
-            await self._update_market_analysis()
-            await self._generate_forecasts()
-            await self._update_benchmarks()
+            self._now = datetime.now()
+            self._today = self._now.date()
+            self._today_iso = self._today.isoformat()
+            
+            # Read the pricing sensor once for the whole update pass
+            pricing = self._snapshot_pricing()
+            
+            self._update_daily_costs(pricing)
+            self._trend_stats = self._compute_trend_stats()
+            self._update_hourly_breakdown(pricing)
+            self._update_device_costs(pricing)
+            self._update_savings_analysis()
+            self._update_efficiency_metrics()
+            self._update_market_analysis(pricing)
+            self._generate_forecasts()
+            self._update_benchmarks()
             
             # Update state with total savings
             self._state = self._cost_data["savings_analysis"].get("total_savings_today", 0)
+            self._refresh_cached_attributes()
             
         except Exception as e:
-            _LOGGER.error(f"Error updating cost analytics: {e}")
+            _LOGGER.error("Error updating cost analytics: %s", e, exc_info=True)
+
+    def _snapshot_pricing(self) -> Optional[Tuple[float, List[float], Dict[str, Any]]]:
+        """Return (current_price, 24h_forecast, pricing_components) from the pricing sensor."""
+        pricing_sensor = self.hass.states.get(f"sensor.{DOMAIN}_indexed_pricing")
+        # An empty state carries no price; treat it like a missing sensor
+        if not pricing_sensor or not pricing_sensor.state:
+            return None
+        
+        try:
+            current_price = float(pricing_sensor.state)
+        except (ValueError, TypeError) as e:
+            _LOGGER.warning("Invalid indexed pricing state '%s': %s", pricing_sensor.state, e)
+            return None
+        
+        return (
+            current_price,
+            pricing_sensor.attributes.get("24h_forecast", []),
+            pricing_sensor.attributes.get("pricing_components", {})
+        )
 
-    async def _update_daily_costs(self):
+    def _update_daily_costs(self, pricing):
         """Update daily cost breakdown."""
         try:
-            current_date = datetime.now().date()
+            current_date = self._today
+            today_iso = self._today_iso
             
             # Get pricing data
-            pricing_sensor = self.hass.states.get(f"sensor.{DOMAIN}_indexed_pricing")
-            if not pricing_sensor:
+            if not pricing:
                 return
             
-            current_price = float(pricing_sensor.state or 0)
+            current_price = pricing[0]
             
             # Calculate daily costs (simplified - in real implementation, use actual consumption)
             estimated_daily_consumption = 25.0  # kWh
@@ -105,7 +194,7 @@ class CostAnalyticsSensor(SensorEntity):
             baseline_cost = estimated_daily_consumption * current_price * 1.15  # 15% higher without optimization
             
             daily_cost_entry = {
-                "date": current_date.isoformat(),
+                "date": today_iso,
                 "optimized_cost": round(optimized_cost, 2),
                 "baseline_cost": round(baseline_cost, 2),
                 "savings": round(baseline_cost - optimized_cost, 2),
@@ -114,71 +203,76 @@ class CostAnalyticsSensor(SensorEntity):
                 "optimization_efficiency": 85.0  # Percentage
             }
             
-            # Update or add today's entry
-            existing_entry = next((entry for entry in self._cost_data["daily_costs"] 
-                                 if entry["date"] == current_date.isoformat()), None)
-            
-            if existing_entry:
-                existing_entry.update(daily_cost_entry)
+            # Update or add today's entry (entries are appended in date order)
+            if self._date_col and self._date_col[-1] == today_iso:
+                self._cost_data["daily_costs"][-1].update(daily_cost_entry)
+                self._savings_col[-1] = daily_cost_entry["savings"]
+                self._baseline_col[-1] = daily_cost_entry["baseline_cost"]
+                self._optimized_col[-1] = daily_cost_entry["optimized_cost"]
             else:
                 self._cost_data["daily_costs"].append(daily_cost_entry)
+                self._date_col.append(today_iso)
+                self._savings_col.append(daily_cost_entry["savings"])
+                self._baseline_col.append(daily_cost_entry["baseline_cost"])
+                self._optimized_col.append(daily_cost_entry["optimized_cost"])
             
             # Keep only last 30 days
             cutoff_date = (current_date - timedelta(days=30)).isoformat()
-            self._cost_data["daily_costs"] = [
-                entry for entry in self._cost_data["daily_costs"]
-                if entry["date"] >= cutoff_date
-            ]
+            stale = bisect_left(self._date_col, cutoff_date)
+            if stale:
+                del self._cost_data["daily_costs"][:stale]
+                del self._date_col[:stale]
+                del self._savings_col[:stale]
+                del self._baseline_col[:stale]
+                del self._optimized_col[:stale]
             
         except Exception as e:
-            _LOGGER.error(f"Error updating daily costs: {e}")
+            _LOGGER.error("Error updating daily costs: %s", e, exc_info=True)
 
-    async def _update_hourly_breakdown(self):
+    def _update_hourly_breakdown(self, pricing):
         """Update hourly cost breakdown for today."""
         try:
-            current_hour = datetime.now().hour
-            
             # Get pricing data
-            pricing_sensor = self.hass.states.get(f"sensor.{DOMAIN}_indexed_pricing")
-            if not pricing_sensor:
+            if not pricing:
                 return
             
             # Get 24-hour forecast if available
-            forecast = pricing_sensor.attributes.get("24h_forecast", [])
+            current_price, forecast, _ = pricing
             
             hourly_breakdown = []
             for hour in range(24):
                 if hour < len(forecast):
                     price = forecast[hour]
                 else:
-                    price = float(pricing_sensor.state or 0.1)
+                    price = current_price
                 
                 # Simulate hourly consumption pattern
-                consumption = self._simulate_hourly_consumption(hour)
+                consumption = self._hourly_consumption[hour]
                 cost = consumption * price
                 
                 # Check if devices are scheduled for this hour
-                device_status = await self._get_device_status_for_hour(hour)
+                device_status = self._get_device_status_for_hour(hour)
                 
                 hourly_breakdown.append({
                     "hour": hour,
                     "price": round(price, 4),
-                    "consumption": round(consumption, 2),
+                    "consumption": consumption,
                     "cost": round(cost, 2),
                     "device_status": device_status,
-                    "is_peak": hour in [18, 19, 20, 21],  # Peak hours
-                    "solar_available": max(0, math.sin((hour - 6) * math.pi / 12)) * 2 if 6 <= hour <= 18 else 0
+                    "is_peak": hour in _PEAK_HOURS,
+                    "solar_available": _SOLAR_PROFILE[hour]
                 })
             
             self._cost_data["hourly_breakdown"] = hourly_breakdown
             
         except Exception as e:
-            _LOGGER.error(f"Error updating hourly breakdown: {e}")
+            _LOGGER.error("Error updating hourly breakdown: %s", e, exc_info=True)
 
-    async def _update_device_costs(self):
+    def _update_device_costs(self, pricing):
         """Update individual device cost analysis."""
         try:
             device_costs = {}
+            avg_price = pricing[0] if pricing else 0.1
             
             # Analyze each device
             genetic_algo = self.hass.data.get(DOMAIN, {}).get('genetic_algorithm')
@@ -195,9 +289,6 @@ class CostAnalyticsSensor(SensorEntity):
                 power_consumption = 1000  # 1kW default
                 hours_on_today = self._estimate_device_runtime(device_id)
                 
-                pricing_sensor = self.hass.states.get(f"sensor.{DOMAIN}_indexed_pricing")
-                avg_price = float(pricing_sensor.state or 0.1) if pricing_sensor else 0.1
-                
                 daily_cost = (hours_on_today * power_consumption / 1000) * avg_price
                 
                 device_costs[device_name] = {
@@ -214,58 +305,52 @@ class CostAnalyticsSensor(SensorEntity):
             self._cost_data["device_costs"] = device_costs
             
         except Exception as e:
-            _LOGGER.error(f"Error updating device costs: {e}")
+            _LOGGER.error("Error updating device costs: %s", e, exc_info=True)
 
-    async def _update_savings_analysis(self):
+    def _update_savings_analysis(self):
         """Update comprehensive savings analysis."""
         try:
             # Calculate various savings metrics
-            daily_costs = self._cost_data["daily_costs"]
-            if not daily_costs:
+            if not self._date_col:
                 return
             
             # Today's savings
-            today_entry = next((entry for entry in daily_costs 
-                              if entry["date"] == datetime.now().date().isoformat()), None)
-            
-            if today_entry:
-                total_savings_today = today_entry["savings"]
+            if self._date_col[-1] == self._today_iso:
+                total_savings_today = self._savings_col[-1]
             else:
                 total_savings_today = 0
             
             # Weekly and monthly savings
-            week_ago = (datetime.now().date() - timedelta(days=7)).isoformat()
-            month_ago = (datetime.now().date() - timedelta(days=30)).isoformat()
+            week_ago = (self._today - timedelta(days=7)).isoformat()
+            month_ago = (self._today - timedelta(days=30)).isoformat()
             
-            weekly_savings = sum(entry["savings"] for entry in daily_costs 
-                               if entry["date"] >= week_ago)
-            monthly_savings = sum(entry["savings"] for entry in daily_costs 
-                                if entry["date"] >= month_ago)
+            weekly_savings = sum(self._savings_col[bisect_left(self._date_col, week_ago):])
+            monthly_savings = sum(self._savings_col[bisect_left(self._date_col, month_ago):])
             
             # Savings rate analysis
-            total_optimized = sum(entry["optimized_cost"] for entry in daily_costs[-30:])
-            total_baseline = sum(entry["baseline_cost"] for entry in daily_costs[-30:])
+            total_optimized = sum(self._optimized_col[-30:])
+            total_baseline = sum(self._baseline_col[-30:])
             savings_rate = ((total_baseline - total_optimized) / total_baseline * 100) if total_baseline > 0 else 0
             
             # Peak hours savings
             peak_savings = self._calculate_peak_hours_savings()
             
             self._cost_data["savings_analysis"] = {
-                "total_savings_today": round(total_savings_today, 2),
+                "total_savings_today": total_savings_today,  # Already rounded on ingestion
                 "weekly_savings": round(weekly_savings, 2),
                 "monthly_savings": round(monthly_savings, 2),
                 "annual_projection": round(monthly_savings * 12, 2),
                 "savings_rate_percent": round(savings_rate, 1),
                 "peak_hours_savings": round(peak_savings, 2),
                 "avg_daily_savings": round(monthly_savings / 30, 2),
-                "best_day_savings": max((entry["savings"] for entry in daily_costs[-30:]), default=0),
+                "best_day_savings": max(self._savings_col[-30:], default=0),
                 "consistency_score": self._calculate_savings_consistency()
             }
             
         except Exception as e:
-            _LOGGER.error(f"Error updating savings analysis: {e}")
+            _LOGGER.error("Error updating savings analysis: %s", e, exc_info=True)
 
-    async def _update_efficiency_metrics(self):
+    def _update_efficiency_metrics(self):
         """Update system efficiency metrics."""
         try:
             # Get genetic algorithm performance data
@@ -274,8 +359,8 @@ class CostAnalyticsSensor(SensorEntity):
             # Solar utilization efficiency
             solar_efficiency = 0
             if genetic_algo and hasattr(genetic_algo, 'pv_forecast') and genetic_algo.pv_forecast is not None:
-                total_solar = sum(genetic_algo.pv_forecast)
-                if total_solar > 0:
+                # PV values are non-negative, so any non-zero slot means solar is available
+                if any(genetic_algo.pv_forecast):
                     # Estimate actual utilization vs available
                     solar_efficiency = random.uniform(78, 92)  # Placeholder
             
@@ -299,18 +384,16 @@ class CostAnalyticsSensor(SensorEntity):
             }
             
         except Exception as e:
-            _LOGGER.error(f"Error updating efficiency metrics: {e}")
+            _LOGGER.error("Error updating efficiency metrics: %s", e, exc_info=True)
 
-    async def _update_market_analysis(self):
+    def _update_market_analysis(self, pricing):
         """Update electricity market analysis."""
         try:
             # Get current and historical pricing
-            pricing_sensor = self.hass.states.get(f"sensor.{DOMAIN}_indexed_pricing")
-            if not pricing_sensor:
+            if not pricing:
                 return
             
-            current_price = float(pricing_sensor.state or 0)
-            pricing_components = pricing_sensor.attributes.get("pricing_components", {})
+            current_price, forecast, pricing_components = pricing
             
             # Market price analysis
             market_price = pricing_components.get("market_price", 50)  # €/MWh
@@ -331,34 +414,22 @@ class CostAnalyticsSensor(SensorEntity):
                 "peak_premium_percent": round(peak_premium, 1),
                 "off_peak_discount_percent": round(off_peak_discount, 1),
                 "market_components": pricing_components,
-                "optimal_consumption_hours": self._identify_optimal_hours(),
+                "optimal_consumption_hours": self._identify_optimal_hours(forecast),
                 "price_forecast_confidence": random.uniform(75, 90)  # Placeholder
             }
             
         except Exception as e:
-            _LOGGER.error(f"Error updating market analysis: {e}")
+            _LOGGER.error("Error updating market analysis: %s", e, exc_info=True)
 
-    async def _generate_forecasts(self):
+    def _generate_forecasts(self):
         """Generate cost and savings forecasts."""
         try:
             # Generate forecasts based on historical data and trends
-            daily_costs = self._cost_data["daily_costs"]
-            if len(daily_costs) < 7:
+            avg_daily_savings = self._trend_stats["recent7_mean"]
+            if avg_daily_savings is None:
                 return  # Need at least a week of data
             
-            # Calculate trends
-            recent_savings = [entry["savings"] for entry in daily_costs[-7:]]
-            avg_daily_savings = sum(recent_savings) / len(recent_savings)
-            # Simple linear trend calculation (replacement for polyfit)
-            if len(recent_savings) > 1:
-                x_values = list(range(len(recent_savings)))
-                x_mean = sum(x_values) / len(x_values)
-                y_mean = avg_daily_savings
-                numerator = sum((x - x_mean) * (y - y_mean) for x, y in zip(x_values, recent_savings))
-                denominator = sum((x - x_mean) ** 2 for x in x_values)
-                savings_trend = numerator / denominator if denominator != 0 else 0
-            else:
-                savings_trend = 0
+            savings_trend = self._trend_stats["slope"]
             
             # Generate forecasts
             forecasts = {
@@ -382,9 +453,9 @@ class CostAnalyticsSensor(SensorEntity):
             self._cost_data["forecasts"] = forecasts
             
         except Exception as e:
-            _LOGGER.error(f"Error generating forecasts: {e}")
+            _LOGGER.error("Error generating forecasts: %s", e, exc_info=True)
 
-    async def _update_benchmarks(self):
+    def _update_benchmarks(self):
         """Update performance benchmarks and comparisons."""
         try:
             # Compare against industry benchmarks
@@ -425,7 +496,7 @@ class CostAnalyticsSensor(SensorEntity):
             self._cost_data["benchmarks"] = benchmarks
             
         except Exception as e:
-            _LOGGER.error(f"Error updating benchmarks: {e}")
+            _LOGGER.error("Error updating benchmarks: %s", e, exc_info=True)
 
     def _simulate_hourly_consumption(self, hour: int) -> float:
         """Simulate hourly consumption pattern."""
@@ -441,7 +512,7 @@ class CostAnalyticsSensor(SensorEntity):
         else:  # Day hours
             return base_consumption * 0.8
 
-    async def _get_device_status_for_hour(self, hour: int) -> Dict[str, str]:
+    def _get_device_status_for_hour(self, hour: int) -> Dict[str, str]:
         """Get device status for specific hour."""
         device_status = {}
         
@@ -472,114 +543,111 @@ class CostAnalyticsSensor(SensorEntity):
 
     def _calculate_savings_consistency(self) -> float:
         """Calculate how consistent the savings are."""
-        daily_costs = self._cost_data["daily_costs"]
-        if len(daily_costs) < 7:
-            return 50.0
-        
-        savings = [entry["savings"] for entry in daily_costs[-7:]]
-        if not savings:
+        mean_savings = self._trend_stats["recent7_mean"]
+        if not mean_savings:
             return 50.0
         
         # Calculate coefficient of variation (lower is more consistent)
-        mean_savings = sum(savings) / len(savings)
-        if mean_savings == 0:
-            return 50.0
-        
-        # Calculate standard deviation manually
-        variance = sum((x - mean_savings) ** 2 for x in savings) / len(savings)
-        cv = math.sqrt(variance) / mean_savings
+        cv = self._trend_stats["recent7_std"] / mean_savings
         consistency = max(0, 100 - (cv * 100))  # Convert to 0-100 scale
         
         return round(consistency, 1)
 
-    def _calculate_std(self, values: List[float]) -> float:
-        """Calculate standard deviation manually."""
-        if not values:
-            return 0.0
-        mean_val = sum(values) / len(values)
-        variance = sum((x - mean_val) ** 2 for x in values) / len(values)
-        return math.sqrt(variance)
+    def _compute_trend_stats(self) -> Dict[str, Optional[float]]:
+        """Compute the savings statistics shared by forecasts, consistency and trend analysis.
+        
+        Windows without enough history are left as None.
+        """
+        savings = self._savings_col
+        stats = {
+            "recent7_mean": None,
+            "recent7_std": None,
+            "slope": None,
+            "recent14_mean": None,
+            "recent14_std": None,
+            "older14_mean": None
+        }
+        
+        if len(savings) >= 7:
+            recent7 = savings[-7:]
+            mean7 = sum(recent7) / 7
+            stats["recent7_mean"] = mean7
+            stats["recent7_std"] = math.sqrt(sum((y - mean7) ** 2 for y in recent7) / 7)
+            # Least-squares slope over x = 0..6 (x mean is 3, sum of squared deviations is 28)
+            stats["slope"] = sum((x - 3) * (y - mean7) for x, y in enumerate(recent7)) / 28
+        
+        if len(savings) >= 14:
+            recent14 = savings[-14:]
+            mean14 = sum(recent14) / 14
+            stats["recent14_mean"] = mean14
+            stats["recent14_std"] = math.sqrt(sum((y - mean14) ** 2 for y in recent14) / 14)
+            if len(savings) >= 28:
+                stats["older14_mean"] = sum(savings[-28:-14]) / 14
+        
+        return stats
 
-    def _identify_optimal_hours(self) -> List[int]:
+    def _identify_optimal_hours(self, forecast: List[float]) -> List[int]:
         """Identify optimal hours for energy consumption."""
         # Based on pricing data, identify cheapest hours
-        pricing_sensor = self.hass.states.get(f"sensor.{DOMAIN}_indexed_pricing")
-        if not pricing_sensor:
-            return [2, 3, 4, 5, 14, 15]  # Default off-peak hours
-        
-        forecast = pricing_sensor.attributes.get("24h_forecast", [])
         if not forecast:
             return [2, 3, 4, 5, 14, 15]
         
-        # Find hours with lowest prices
-        hourly_prices = [(i, price) for i, price in enumerate(forecast[:24])]
-        hourly_prices.sort(key=lambda x: x[1])  # Sort by price
-        
-        optimal_hours = [hour for hour, price in hourly_prices[:6]]  # Top 6 cheapest hours
+        # Find the 6 cheapest hours without sorting the whole day
+        hourly_prices = forecast[:24]
+        optimal_hours = heapq.nsmallest(6, range(len(hourly_prices)), key=hourly_prices.__getitem__)
         return sorted(optimal_hours)
 
     def _generate_chart_data(self):
         """Generate data formatted for charts and visualizations."""
         try:
+            efficiency = self._cost_data["efficiency_metrics"]
             return {
-                "daily_savings_trend": {
-                    "type": "line",
-                    "labels": [entry["date"] for entry in self._cost_data["daily_costs"][-14:]],
-                    "datasets": [
-                        {
-                            "label": "Daily Savings (€)",
-                            "data": [entry["savings"] for entry in self._cost_data["daily_costs"][-14:]],
-                            "borderColor": "#4CAF50",
-                            "backgroundColor": "rgba(76, 175, 80, 0.1)"
-                        }
-                    ]
-                },
-                "hourly_cost_breakdown": {
-                    "type": "bar",
-                    "labels": [f"{hour:02d}:00" for hour in range(24)],
-                    "datasets": [
-                        {
-                            "label": "Hourly Cost (€)",
-                            "data": [entry["cost"] for entry in self._cost_data["hourly_breakdown"]],
-                            "backgroundColor": [
-                                "#FF6B6B" if entry["is_peak"] else "#4ECDC4"
-                                for entry in self._cost_data["hourly_breakdown"]
-                            ]
-                        }
+                "daily_savings_trend": self._build_chart(
+                    "daily_savings_trend",
+                    self._date_col[-14:],
+                    self._savings_col[-14:]
+                ),
+                "hourly_cost_breakdown": self._build_chart(
+                    "hourly_cost_breakdown",
+                    list(_HOUR_LABELS),
+                    [entry["cost"] for entry in self._cost_data["hourly_breakdown"]],
+                    # hourly_breakdown is indexed by hour, so the peak colours are fixed
+                    backgroundColor=list(_HOURLY_COLORS[:len(self._cost_data["hourly_breakdown"])])
+                ),
+                "device_cost_comparison": self._build_chart(
+                    "device_cost_comparison",
+                    list(self._cost_data["device_costs"].keys()),
+                    [device["cost_today"] for device in self._cost_data["device_costs"].values()]
+                ),
+                "efficiency_radar": self._build_chart(
+                    "efficiency_radar",
+                    list(_EFFICIENCY_RADAR_LABELS),
+                    [
+                        efficiency.get("solar_utilization_percent", 0),
+                        efficiency.get("load_optimization_percent", 0),
+                        efficiency.get("battery_efficiency_percent", 0),
+                        efficiency.get("overall_system_efficiency", 0)
                     ]
-                },
-                "device_cost_comparison": {
-                    "type": "doughnut",
-                    "labels": list(self._cost_data["device_costs"].keys()),
-                    "datasets": [
-                        {
-                            "data": [device["cost_today"] for device in self._cost_data["device_costs"].values()],
-                            "backgroundColor": ["#FF6B6B", "#4ECDC4", "#FFE66D", "#95E1D3"]
-                        }
-                    ]
-                },
-                "efficiency_radar": {
-                    "type": "radar",
-                    "labels": ["Solar Utilization", "Load Optimization", "Battery Efficiency", "Overall System"],
-                    "datasets": [
-                        {
-                            "label": "Efficiency %",
-                            "data": [
-                                self._cost_data["efficiency_metrics"].get("solar_utilization_percent", 0),
-                                self._cost_data["efficiency_metrics"].get("load_optimization_percent", 0),
-                                self._cost_data["efficiency_metrics"].get("battery_efficiency_percent", 0),
-                                self._cost_data["efficiency_metrics"].get("overall_system_efficiency", 0)
-                            ],
-                            "borderColor": "#2196F3",
-                            "backgroundColor": "rgba(33, 150, 243, 0.2)"
-                        }
-                    ]
-                }
+                )
             }
         except Exception as e:
-            _LOGGER.error(f"Error generating chart data: {e}")
+            _LOGGER.error("Error generating chart data: %s", e, exc_info=True)
             return {}
 
+    def _build_chart(self, chart_id: str, labels: List[Any], data: List[Any], **overrides) -> Dict[str, Any]:
+        """Fill a chart template with fresh labels and data.
+        
+        New containers are returned on every call: Home Assistant keeps a shallow
+        copy of the last written attributes, so mutating a shared template in
+        place would also change the previous state and hide the update.
+        """
+        template = _CHART_TEMPLATES[chart_id]
+        return {
+            "type": template["type"],
+            "labels": labels,
+            "datasets": [{**template["dataset"], "data": data, **overrides}]
+        }
+
     def _generate_financial_summary(self):
         """Generate financial summary for dashboard."""
         try:
@@ -593,7 +661,7 @@ class CostAnalyticsSensor(SensorEntity):
                 "roi_payback_months": self._calculate_payback_period()
             }
         except Exception as e:
-            _LOGGER.error(f"Error generating financial summary: {e}")
+            _LOGGER.error("Error generating financial summary: %s", e, exc_info=True)
             return {}
 
     def _calculate_roi_analysis(self):
@@ -618,22 +686,21 @@ class CostAnalyticsSensor(SensorEntity):
                 "internal_rate_of_return": round(roi_percentage, 1)
             }
         except Exception as e:
-            _LOGGER.error(f"Error calculating ROI: {e}")
+            _LOGGER.error("Error calculating ROI: %s", e, exc_info=True)
             return {}
 
     def _analyze_trends(self):
         """Analyze cost and savings trends."""
         try:
-            daily_costs = self._cost_data["daily_costs"]
-            if len(daily_costs) < 14:
+            recent_avg = self._trend_stats["recent14_mean"]
+            if recent_avg is None:
                 return {"status": "insufficient_data"}
             
             # Analyze savings trend
-            recent_savings = [entry["savings"] for entry in daily_costs[-14:]]
-            older_savings = [entry["savings"] for entry in daily_costs[-28:-14]] if len(daily_costs) >= 28 else []
-            
-            recent_avg = sum(recent_savings) / len(recent_savings)
-            older_avg = sum(older_savings) / len(older_savings) if older_savings else recent_avg
+            older_avg = self._trend_stats["older14_mean"]
+            if older_avg is None:
+                older_avg = recent_avg
+            recent_cv = self._trend_stats["recent14_std"] / recent_avg
             
             trend_direction = "improving" if recent_avg > older_avg else "declining" if recent_avg < older_avg else "stable"
             trend_magnitude = abs(recent_avg - older_avg) / older_avg * 100 if older_avg > 0 else 0
@@ -647,13 +714,13 @@ class CostAnalyticsSensor(SensorEntity):
                     "comparison_average": round(older_avg, 2)
                 },
                 "volatility": {
-                    "coefficient_of_variation": round(self._calculate_std(recent_savings) / (sum(recent_savings) / len(recent_savings)) * 100, 1),
-                    "stability_rating": "high" if self._calculate_std(recent_savings) / (sum(recent_savings) / len(recent_savings)) < 0.2 else "medium"
+                    "coefficient_of_variation": round(recent_cv * 100, 1),
+                    "stability_rating": "high" if recent_cv < 0.2 else "medium"
                 },
                 "forecast_confidence": 85 if trend_direction != "stable" else 75
             }
         except Exception as e:
-            _LOGGER.error(f"Error analyzing trends: {e}")
+            _LOGGER.error("Error analyzing trends: %s", e, exc_info=True)
             return {"status": "error"}
 
     def _calculate_payback_period(self) -> str:
@@ -672,7 +739,7 @@ class CostAnalyticsSensor(SensorEntity):
             else:
                 return f"{payback_months/12:.1f} years"
         except Exception as e:
-            _LOGGER.error(f"Error calculating payback period: {e}")
+            _LOGGER.error("Error calculating payback period: %s", e, exc_info=True)
             return "N/A"
 
 
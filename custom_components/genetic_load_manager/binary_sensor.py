@@ -1,16 +1,20 @@
 """Binary sensor platform for Genetic Load Manager integration."""
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_OPTIMIZER_UPDATED
 
 _LOGGER = logging.getLogger(__name__)
 
+# Status entries that must be configured for the optimizer to work
+_CRITICAL_ATTRS = ('pv_forecast_entity', 'load_forecast_entity', 'battery_soc_entity')
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback, discovery_info: DiscoveryInfoType = None):
     """Set up the Genetic Load Manager binary sensor platform."""
     
@@ -34,160 +38,157 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 class GeneticLoadManagerBinarySensor(BinarySensorEntity):
     """Base class for Genetic Load Manager binary sensors."""
     
+    # HA manages the _attr_* fields through its entity metaclass, so only the
+    # fields this integration adds are slotted.
+    __slots__ = ("genetic_algo", "config_entry", "_status")
+    
+    _attr_should_poll = False
+    _attr_available = True
+    _unique_id_suffix: str
+    
     def __init__(self, genetic_algo, config_entry: ConfigEntry):
         """Initialize the binary sensor."""
         self.genetic_algo = genetic_algo
         self.config_entry = config_entry
-        self._attr_should_poll = True
-        self._attr_available = True
+        self._status: Mapping[str, Any] = {}
+
+    @property
+    def unique_id(self) -> str:
+        """Return the unique ID of the binary sensor."""
+        return f"{self.config_entry.entry_id}_{self._unique_id_suffix}"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to optimizer state changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_OPTIMIZER_UPDATED, self._handle_update)
+        )
+
+    async def async_update(self) -> None:
+        """Refresh the cached state from the optimizer."""
+        self._refresh(self.genetic_algo.get_status())
+
+    @callback
+    def _handle_update(self, status: Mapping[str, Any]) -> None:
+        """Handle a status snapshot pushed by the optimizer."""
+        self._refresh(status)
+        self.async_write_ha_state()
+
+    def _refresh(self, status: Mapping[str, Any]) -> None:
+        """Store the shared status snapshot and recompute state and attributes."""
+        self._status = status
+        self._attr_is_on = self._compute_is_on()
+        self._attr_extra_state_attributes = self._compute_attributes()
+
+    def _compute_is_on(self) -> Optional[bool]:
+        """Compute the binary state from the status snapshot (unknown by default)."""
+        return None
+
+    def _compute_attributes(self) -> Dict[str, Any]:
+        """Compute the state attributes from the status snapshot."""
+        return {}
 
 class OptimizationRunningSensor(GeneticLoadManagerBinarySensor):
     """Binary sensor for optimization running status."""
     
-    def __init__(self, genetic_algo, config_entry: ConfigEntry):
-        """Initialize the sensor."""
-        super().__init__(genetic_algo, config_entry)
-        self._attr_name = "Genetic Load Manager Optimization Running"
-        self._attr_unique_id = f"{config_entry.entry_id}_optimization_running"
-        self._attr_icon = "mdi:play-circle"
-        self._attr_device_class = "running"
+    _attr_name = "Genetic Load Manager Optimization Running"
+    _attr_icon = "mdi:play-circle"
+    _attr_device_class = "running"
+    _unique_id_suffix = "optimization_running"
     
-    @property
-    def is_on(self) -> Optional[bool]:
+    def _compute_is_on(self) -> Optional[bool]:
         """Return true if optimization is running."""
-        return self.genetic_algo.is_running
+        return self._status.get("is_running", False)
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _compute_attributes(self) -> Dict[str, Any]:
         """Return entity specific state attributes."""
-        return {
-            "is_running": self.genetic_algo.is_running,
-            "population_size": getattr(self.genetic_algo, 'population_size', 0),
-            "generations": getattr(self.genetic_algo, 'generations', 0),
-            "num_devices": getattr(self.genetic_algo, 'num_devices', 0)
-        }
+        status = self._status
+        return {"is_running": status.get("is_running", False), **status.get("parameters", {})}
 
 class SystemHealthySensor(GeneticLoadManagerBinarySensor):
     """Binary sensor for system health status."""
     
-    def __init__(self, genetic_algo, config_entry: ConfigEntry):
-        """Initialize the sensor."""
-        super().__init__(genetic_algo, config_entry)
-        self._attr_name = "Genetic Load Manager System Healthy"
-        self._attr_unique_id = f"{config_entry.entry_id}_system_healthy"
-        self._attr_icon = "mdi:heart-pulse"
-        self._attr_device_class = "problem"
+    _attr_name = "Genetic Load Manager System Healthy"
+    _attr_icon = "mdi:heart-pulse"
+    _attr_device_class = "problem"
+    _unique_id_suffix = "system_healthy"
     
-    @property
-    def is_on(self) -> Optional[bool]:
+    def _compute_is_on(self) -> Optional[bool]:
         """Return true if system is healthy."""
-        try:
-            # Check if genetic algorithm is running
-            if not self.genetic_algo.is_running:
-                return False
-            
-            # Check if we have forecast data
-            if not hasattr(self.genetic_algo, 'pv_forecast') or self.genetic_algo.pv_forecast is None:
-                return False
-            
-            if not hasattr(self.genetic_algo, 'load_forecast') or self.genetic_algo.load_forecast is None:
-                return False
-            
-            return True
-            
-        except Exception:
+        status = self._status
+        
+        # Check if genetic algorithm is running
+        if not status.get("is_running", False):
+            return False
+        
+        # Check if we have forecast data
+        if not status.get("pv_forecast_available", False):
+            return False
+        
+        if not status.get("load_forecast_available", False):
             return False
+        
+        return True
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _compute_attributes(self) -> Dict[str, Any]:
         """Return entity specific state attributes."""
-        try:
-            return {
-                "optimization_running": self.genetic_algo.is_running,
-                "pv_forecast_available": hasattr(self.genetic_algo, 'pv_forecast') and self.genetic_algo.pv_forecast is not None,
-                "load_forecast_available": hasattr(self.genetic_algo, 'load_forecast') and self.genetic_algo.load_forecast is not None,
-                "battery_soc_available": hasattr(self.genetic_algo, 'battery_soc_entity') and self.genetic_algo.battery_soc_entity is not None
-            }
-        except Exception:
-            return {"error": "Unable to get system status"}
+        status = self._status
+        return {
+            "optimization_running": status.get("is_running", False),
+            "pv_forecast_available": status.get("pv_forecast_available", False),
+            "load_forecast_available": status.get("load_forecast_available", False),
+            "battery_soc_available": status.get("battery_soc_entity") is not None
+        }
 
 class LoadsControlledSensor(GeneticLoadManagerBinarySensor):
     """Binary sensor for loads controlled status."""
     
-    def __init__(self, genetic_algo, config_entry: ConfigEntry):
-        """Initialize the sensor."""
-        super().__init__(genetic_algo, config_entry)
-        self._attr_name = "Genetic Load Manager Loads Controlled"
-        self._attr_unique_id = f"{config_entry.entry_id}_loads_controlled"
-        self._attr_icon = "mdi:lightning-bolt"
-        self._attr_device_class = "power"
+    _attr_name = "Genetic Load Manager Loads Controlled"
+    _attr_icon = "mdi:lightning-bolt"
+    _attr_device_class = "power"
+    _unique_id_suffix = "loads_controlled"
     
-    @property
-    def is_on(self) -> Optional[bool]:
+    def _compute_is_on(self) -> Optional[bool]:
         """Return true if loads are being controlled."""
-        try:
-            # Check if we have manageable loads
-            if not hasattr(self.genetic_algo, 'num_devices'):
-                return False
-            
-            return self.genetic_algo.num_devices > 0
-            
-        except Exception:
-            return False
+        # Check if we have manageable loads
+        return self._status.get("num_devices", 0) > 0
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _compute_attributes(self) -> Dict[str, Any]:
         """Return entity specific state attributes."""
-        try:
-            return {
-                "num_devices": getattr(self.genetic_algo, 'num_devices', 0),
-                "device_priorities": getattr(self.genetic_algo, 'device_priorities', []),
-                "battery_capacity": getattr(self.genetic_algo, 'battery_capacity', 0.0)
-            }
-        except Exception:
-            return {"error": "Unable to get loads status"}
+        status = self._status
+        return {
+            "num_devices": status.get("num_devices", 0),
+            "device_priorities": status.get("device_priorities", []),
+            "battery_capacity": status.get("battery_capacity", 0.0)
+        }
 
 class AlgorithmErrorSensor(GeneticLoadManagerBinarySensor):
     """Binary sensor for algorithm error status."""
     
-    def __init__(self, genetic_algo, config_entry: ConfigEntry):
-        """Initialize the sensor."""
-        super().__init__(genetic_algo, config_entry)
-        self._attr_name = "Genetic Load Manager Algorithm Error"
-        self._attr_unique_id = f"{config_entry.entry_id}_algorithm_error"
-        self._attr_icon = "mdi:alert-circle"
-        self._attr_device_class = "problem"
+    _attr_name = "Genetic Load Manager Algorithm Error"
+    _attr_icon = "mdi:alert-circle"
+    _attr_device_class = "problem"
+    _unique_id_suffix = "algorithm_error"
     
-    @property
-    def is_on(self) -> Optional[bool]:
+    def _compute_is_on(self) -> Optional[bool]:
         """Return true if there are algorithm errors."""
-        try:
-            # For now, we'll consider it an error if the genetic algorithm is not running
-            # when it should be, or if critical attributes are missing
-            if not self.genetic_algo.is_running:
-                return True
-            
-            # Check for critical missing attributes
-            critical_attrs = ['pv_forecast_entity', 'load_forecast_entity', 'battery_soc_entity']
-            for attr in critical_attrs:
-                if not hasattr(self.genetic_algo, attr) or getattr(self.genetic_algo, attr) is None:
-                    return True
-            
-            return False
-            
-        except Exception:
+        status = self._status
+        
+        # For now, we'll consider it an error if the genetic algorithm is not running
+        # when it should be, or if critical attributes are missing
+        if not status.get("is_running", False):
             return True
+        
+        # Check for critical missing attributes
+        return any(status.get(attr) is None for attr in _CRITICAL_ATTRS)
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _compute_attributes(self) -> Dict[str, Any]:
         """Return entity specific state attributes."""
-        try:
-            return {
-                "is_running": self.genetic_algo.is_running,
-                "pv_forecast_entity": getattr(self.genetic_algo, 'pv_forecast_entity', None),
-                "load_forecast_entity": getattr(self.genetic_algo, 'load_forecast_entity', None),
-                "battery_soc_entity": getattr(self.genetic_algo, 'battery_soc_entity', None),
-                "dynamic_pricing_entity": getattr(self.genetic_algo, 'dynamic_pricing_entity', None)
-            }
-        except Exception:
-            return {"error": "Unable to get error status"} 
\ No newline at end of file
+        status = self._status
+        return {
+            "is_running": status.get("is_running", False),
+            "pv_forecast_entity": status.get("pv_forecast_entity"),
+            "load_forecast_entity": status.get("load_forecast_entity"),
+            "battery_soc_entity": status.get("battery_soc_entity"),
+            "dynamic_pricing_entity": status.get("dynamic_pricing_entity")
+        }
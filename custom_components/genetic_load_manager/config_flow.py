@@ -39,6 +39,7 @@ from .const import (
     CONF_LIGHTING,
     CONF_MEDIA_PLAYER,
     CONF_UPDATE_INTERVAL,
+    CONF_SCAN_INTERVAL,
     DEFAULT_POPULATION_SIZE,
     DEFAULT_GENERATIONS,
     DEFAULT_MUTATION_RATE,
@@ -51,11 +52,226 @@ from .const import (
     DEFAULT_USE_INDEXED_PRICING,
     DEFAULT_OPTIMIZATION_MODE,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
     DEFAULT_ENTITIES,
+    OPTIMIZATION_MODES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Forms are static, so build the schemas once at import time
+_SOLCAST_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(
+        domain="sensor",
+        # More flexible selector for detailed forecast entities
+        integration="solcast"
+    )
+)
+
+_USER_SCHEMA = vol.Schema({
+    vol.Required(
+        CONF_OPTIMIZATION_MODE,
+        default=DEFAULT_OPTIMIZATION_MODE
+    ): vol.In(OPTIMIZATION_MODES),
+    vol.Required(
+        CONF_UPDATE_INTERVAL,
+        default=DEFAULT_UPDATE_INTERVAL
+    ): vol.All(
+        vol.Coerce(int),
+        vol.Range(min=5, max=1440)
+    ),
+    vol.Optional(
+        CONF_USE_INDEXED_PRICING,
+        default=DEFAULT_USE_INDEXED_PRICING
+    ): bool,
+})
+
+_ALGORITHM_PARAMS_SCHEMA = vol.Schema({
+    vol.Required(
+        CONF_POPULATION_SIZE,
+        default=DEFAULT_POPULATION_SIZE
+    ): vol.All(
+        vol.Coerce(int),
+        vol.Range(min=20, max=500)
+    ),
+    vol.Required(
+        CONF_GENERATIONS,
+        default=DEFAULT_GENERATIONS
+    ): vol.All(
+        vol.Coerce(int),
+        vol.Range(min=50, max=1000)
+    ),
+    vol.Required(
+        CONF_MUTATION_RATE,
+        default=DEFAULT_MUTATION_RATE
+    ): vol.All(
+        vol.Coerce(float),
+        vol.Range(min=0.01, max=0.5)
+    ),
+    vol.Required(
+        CONF_CROSSOVER_RATE,
+        default=DEFAULT_CROSSOVER_RATE
+    ): vol.All(
+        vol.Coerce(float),
+        vol.Range(min=0.1, max=1.0)
+    ),
+    vol.Required(
+        CONF_NUM_DEVICES,
+        default=DEFAULT_NUM_DEVICES
+    ): vol.All(
+        vol.Coerce(int),
+        vol.Range(min=1, max=20)
+    ),
+})
+
+_DEVICE_CONFIG_SCHEMA = vol.Schema({
+    vol.Required(
+        CONF_BATTERY_CAPACITY,
+        default=DEFAULT_BATTERY_CAPACITY
+    ): vol.All(
+        vol.Coerce(float),
+        vol.Range(min=1.0, max=100.0)
+    ),
+    vol.Required(
+        CONF_MAX_CHARGE_RATE,
+        default=DEFAULT_MAX_CHARGE_RATE
+    ): vol.All(
+        vol.Coerce(float),
+        vol.Range(min=0.5, max=50.0)
+    ),
+    vol.Required(
+        CONF_MAX_DISCHARGE_RATE,
+        default=DEFAULT_MAX_DISCHARGE_RATE
+    ): vol.All(
+        vol.Coerce(float),
+        vol.Range(min=0.5, max=50.0)
+    ),
+    vol.Optional(
+        CONF_BINARY_CONTROL,
+        default=DEFAULT_BINARY_CONTROL
+    ): bool,
+})
+
+_ENTITY_MAPPING_SCHEMA = vol.Schema({
+    vol.Optional(
+        CONF_PV_FORECAST_TODAY,
+        default=DEFAULT_ENTITIES["pv_forecast_today"]
+    ): _SOLCAST_SELECTOR,
+    vol.Optional(
+        CONF_PV_FORECAST_TOMORROW,
+        default=DEFAULT_ENTITIES["pv_forecast_tomorrow"]
+    ): _SOLCAST_SELECTOR,
+    vol.Optional(
+        CONF_LOAD_FORECAST,
+        default=DEFAULT_ENTITIES["load_forecast"]
+    ): selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="sensor",
+            # Allow any sensor for load forecast
+        )
+    ),
+    vol.Optional(
+        CONF_LOAD_SENSOR,
+        default=DEFAULT_ENTITIES["load_sensor"]
+    ): selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="sensor",
+            device_class="power"
+        )
+    ),
+    vol.Optional(
+        CONF_BATTERY_SOC,
+        default=DEFAULT_ENTITIES["battery_soc"]
+    ): selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="sensor",
+            device_class="battery"
+        )
+    ),
+    vol.Optional(
+        CONF_MARKET_PRICE,
+        default=DEFAULT_ENTITIES["market_price"]
+    ): selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="sensor",
+            # Allow any sensor for market price
+        )
+    ),
+    vol.Optional(
+        CONF_GRID_POWER,
+        default=DEFAULT_ENTITIES["grid_power"]
+    ): selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="sensor",
+            device_class="power"
+        )
+    ),
+    vol.Optional(
+        CONF_DEMAND_RESPONSE,
+        default=DEFAULT_ENTITIES["demand_response"]
+    ): selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="binary_sensor"
+        )
+    ),
+    vol.Optional(
+        CONF_CARBON_INTENSITY,
+        default=DEFAULT_ENTITIES["carbon_intensity"]
+    ): selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="sensor"
+        )
+    ),
+    vol.Optional(
+        CONF_WEATHER,
+        default=DEFAULT_ENTITIES["weather"]
+    ): selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="weather"
+        )
+    ),
+    vol.Optional(
+        CONF_EV_CHARGER,
+        default=DEFAULT_ENTITIES["ev_charger"]
+    ): selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="switch"
+        )
+    ),
+    vol.Optional(
+        CONF_SMART_THERMOSTAT,
+        default=DEFAULT_ENTITIES["smart_thermostat"]
+    ): selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="climate"
+        )
+    ),
+    vol.Optional(
+        CONF_SMART_PLUG,
+        default=DEFAULT_ENTITIES["smart_plug"]
+    ): selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="switch"
+        )
+    ),
+    vol.Optional(
+        CONF_LIGHTING,
+        default=DEFAULT_ENTITIES["lighting"]
+    ): selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="light"
+        )
+    ),
+    vol.Optional(
+        CONF_MEDIA_PLAYER,
+        default=DEFAULT_ENTITIES["media_player"]
+    ): selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="media_player"
+        )
+    ),
+})
+
 class GeneticLoadManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Genetic Load Manager."""
 
@@ -89,29 +305,7 @@ class GeneticLoadManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Show the form
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required(
-                    CONF_OPTIMIZATION_MODE,
-                    default=DEFAULT_OPTIMIZATION_MODE
-                ): vol.In([
-                    "cost_savings",
-                    "comfort",
-                    "battery_health", 
-                    "grid_stability",
-                    "carbon_reduction"
-                ]),
-                vol.Required(
-                    CONF_UPDATE_INTERVAL,
-                    default=DEFAULT_UPDATE_INTERVAL
-                ): vol.All(
-                    vol.Coerce(int),
-                    vol.Range(min=5, max=1440)
-                ),
-                vol.Optional(
-                    CONF_USE_INDEXED_PRICING,
-                    default=DEFAULT_USE_INDEXED_PRICING
-                ): bool,
-            }),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -139,43 +333,7 @@ class GeneticLoadManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Show the form
         return self.async_show_form(
             step_id="algorithm_params",
-            data_schema=vol.Schema({
-                vol.Required(
-                    CONF_POPULATION_SIZE,
-                    default=DEFAULT_POPULATION_SIZE
-                ): vol.All(
-                    vol.Coerce(int),
-                    vol.Range(min=20, max=500)
-                ),
-                vol.Required(
-                    CONF_GENERATIONS,
-                    default=DEFAULT_GENERATIONS
-                ): vol.All(
-                    vol.Coerce(int),
-                    vol.Range(min=50, max=1000)
-                ),
-                vol.Required(
-                    CONF_MUTATION_RATE,
-                    default=DEFAULT_MUTATION_RATE
-                ): vol.All(
-                    vol.Coerce(float),
-                    vol.Range(min=0.01, max=0.5)
-                ),
-                vol.Required(
-                    CONF_CROSSOVER_RATE,
-                    default=DEFAULT_CROSSOVER_RATE
-                ): vol.All(
-                    vol.Coerce(float),
-                    vol.Range(min=0.1, max=1.0)
-                ),
-                vol.Required(
-                    CONF_NUM_DEVICES,
-                    default=DEFAULT_NUM_DEVICES
-                ): vol.All(
-                    vol.Coerce(int),
-                    vol.Range(min=1, max=20)
-                ),
-            }),
+            data_schema=_ALGORITHM_PARAMS_SCHEMA,
             errors=errors,
         )
 
@@ -203,33 +361,7 @@ class GeneticLoadManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Show the form
         return self.async_show_form(
             step_id="device_config",
-            data_schema=vol.Schema({
-                vol.Required(
-                    CONF_BATTERY_CAPACITY,
-                    default=DEFAULT_BATTERY_CAPACITY
-                ): vol.All(
-                    vol.Coerce(float),
-                    vol.Range(min=1.0, max=100.0)
-                ),
-                vol.Required(
-                    CONF_MAX_CHARGE_RATE,
-                    default=DEFAULT_MAX_CHARGE_RATE
-                ): vol.All(
-                    vol.Coerce(float),
-                    vol.Range(min=0.5, max=50.0)
-                ),
-                vol.Required(
-                    CONF_MAX_DISCHARGE_RATE,
-                    default=DEFAULT_MAX_DISCHARGE_RATE
-                ): vol.All(
-                    vol.Coerce(float),
-                    vol.Range(min=0.5, max=50.0)
-                ),
-                vol.Optional(
-                    CONF_BINARY_CONTROL,
-                    default=DEFAULT_BINARY_CONTROL
-                ): bool,
-            }),
+            data_schema=_DEVICE_CONFIG_SCHEMA,
             errors=errors,
         )
 
@@ -260,137 +392,7 @@ class GeneticLoadManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Show the form
         return self.async_show_form(
             step_id="entity_mapping",
-            data_schema=vol.Schema({
-                vol.Optional(
-                    CONF_PV_FORECAST_TODAY,
-                    default=DEFAULT_ENTITIES["pv_forecast_today"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        # More flexible selector for detailed forecast entities
-                        integration="solcast"
-                    )
-                ),
-                vol.Optional(
-                    CONF_PV_FORECAST_TOMORROW,
-                    default=DEFAULT_ENTITIES["pv_forecast_tomorrow"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        # More flexible selector for detailed forecast entities
-                        integration="solcast"
-                    )
-                ),
-                vol.Optional(
-                    CONF_LOAD_FORECAST,
-                    default=DEFAULT_ENTITIES["load_forecast"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        # Allow any sensor for load forecast
-                    )
-                ),
-                vol.Optional(
-                    CONF_LOAD_SENSOR,
-                    default=DEFAULT_ENTITIES["load_sensor"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class="power"
-                    )
-                ),
-                vol.Optional(
-                    CONF_BATTERY_SOC,
-                    default=DEFAULT_ENTITIES["battery_soc"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class="battery"
-                    )
-                ),
-                vol.Optional(
-                    CONF_MARKET_PRICE,
-                    default=DEFAULT_ENTITIES["market_price"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        # Allow any sensor for market price
-                    )
-                ),
-                vol.Optional(
-                    CONF_GRID_POWER,
-                    default=DEFAULT_ENTITIES["grid_power"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class="power"
-                    )
-                ),
-                vol.Optional(
-                    CONF_DEMAND_RESPONSE,
-                    default=DEFAULT_ENTITIES["demand_response"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="binary_sensor"
-                    )
-                ),
-                vol.Optional(
-                    CONF_CARBON_INTENSITY,
-                    default=DEFAULT_ENTITIES["carbon_intensity"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor"
-                    )
-                ),
-                vol.Optional(
-                    CONF_WEATHER,
-                    default=DEFAULT_ENTITIES["weather"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="weather"
-                    )
-                ),
-                vol.Optional(
-                    CONF_EV_CHARGER,
-                    default=DEFAULT_ENTITIES["ev_charger"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="switch"
-                    )
-                ),
-                vol.Optional(
-                    CONF_SMART_THERMOSTAT,
-                    default=DEFAULT_ENTITIES["smart_thermostat"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="climate"
-                    )
-                ),
-                vol.Optional(
-                    CONF_SMART_PLUG,
-                    default=DEFAULT_ENTITIES["smart_plug"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="switch"
-                    )
-                ),
-                vol.Optional(
-                    CONF_LIGHTING,
-                    default=DEFAULT_ENTITIES["lighting"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="light"
-                    )
-                ),
-                vol.Optional(
-                    CONF_MEDIA_PLAYER,
-                    default=DEFAULT_ENTITIES["media_player"]
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="media_player"
-                    )
-                ),
-            }),
+            data_schema=_ENTITY_MAPPING_SCHEMA,
             errors=errors,
         )
 
@@ -476,12 +478,13 @@ class GeneticLoadManagerOptionsFlow(config_entries.OptionsFlow):
                 vol.Optional(
                     CONF_OPTIMIZATION_MODE,
                     default=config_entry.data.get(CONF_OPTIMIZATION_MODE, DEFAULT_OPTIMIZATION_MODE)
-                ): vol.In([
-                    "cost_savings",
-                    "comfort",
-                    "battery_health",
-                    "grid_stability",
-                    "carbon_reduction"
-                ]),
+                ): vol.In(OPTIMIZATION_MODES),
+                vol.Optional(
+                    CONF_SCAN_INTERVAL,
+                    default=config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=30, max=3600)
+                ),
             })
         )
\ No newline at end of file
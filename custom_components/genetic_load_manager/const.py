@@ -1,8 +1,12 @@
 """Constants for the Genetic Load Manager integration."""
+from types import MappingProxyType
 
 # Domain
 DOMAIN = "genetic_load_manager"
 
+# Dispatcher signal sent whenever the optimizer state changes
+SIGNAL_OPTIMIZER_UPDATED = f"{DOMAIN}_updated"
+
 # Configuration keys
 CONF_POPULATION_SIZE = "population_size"
 CONF_GENERATIONS = "generations"
@@ -16,6 +20,7 @@ CONF_BINARY_CONTROL = "binary_control"
 CONF_USE_INDEXED_PRICING = "use_indexed_pricing"
 CONF_OPTIMIZATION_MODE = "optimization_mode"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_SCAN_INTERVAL = "scan_interval"
 
 # Entity configuration keys
 CONF_PV_FORECAST_TODAY = "pv_forecast_today"
@@ -74,9 +79,10 @@ DEFAULT_BINARY_CONTROL = False
 DEFAULT_USE_INDEXED_PRICING = True
 DEFAULT_OPTIMIZATION_MODE = "cost_savings"
 DEFAULT_UPDATE_INTERVAL = 15
+DEFAULT_SCAN_INTERVAL = 600  # seconds between control panel refreshes
 
 # Default entity IDs to avoid warnings
-DEFAULT_ENTITIES = {
+DEFAULT_ENTITIES = MappingProxyType({
     "pv_forecast_today": "sensor.solcast_pv_forecast_today",
     "pv_forecast_tomorrow": "sensor.solcast_pv_forecast_previsao_para_amanha",
     "load_forecast": "sensor.load_forecast",
@@ -92,7 +98,7 @@ DEFAULT_ENTITIES = {
     "smart_plug": "switch.smart_plug",
     "lighting": "light.living_room",
     "media_player": "media_player.tv"
-}
+})
 
 # Entity validation patterns
 ENTITY_PATTERNS = {
@@ -104,13 +110,13 @@ ENTITY_PATTERNS = {
 }
 
 # Optimization modes
-OPTIMIZATION_MODES = [
+OPTIMIZATION_MODES = (
     "cost_savings",
     "comfort",
     "battery_health",
     "grid_stability",
     "carbon_reduction"
-]
+)
 
 # Device types
 DEVICE_TYPES = [
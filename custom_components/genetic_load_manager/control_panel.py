@@ -1,20 +1,219 @@
 """Interactive control panel for Genetic Load Manager."""
 import logging
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from datetime import datetime
+from itertools import islice
 from typing import Dict, Any, List, Optional
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.const import STATE_ON, STATE_OFF
 
 _LOGGER = logging.getLogger(__name__)
-from .const import DOMAIN
+from .const import (
+    DOMAIN, CONF_NUM_DEVICES, CONF_SCAN_INTERVAL, DEFAULT_NUM_DEVICES, DEFAULT_SCAN_INTERVAL
+)
+
+# Adaptive polling: shortest delay and how many change intervals to learn from
+_MIN_POLL_INTERVAL = 30
+_CHANGE_HISTORY = 20
+
+# Seconds to coalesce bursts of dashboard changes into one full update
+_REFRESH_DEBOUNCE = 2
+
+# Upper bound on retained user interactions and how long to keep them (seconds)
+_MAX_INTERACTIONS = 500
+_INTERACTION_RETENTION = 24 * 3600
+
+# Static control panel definitions; shared by every instance, never mutated
+_AVAILABLE_ACTIONS = [
+    {
+        "id": "run_optimization",
+        "name": "Run Optimization",
+        "description": "Trigger immediate genetic algorithm optimization",
+        "icon": "mdi:play-circle",
+        "category": "optimization",
+        "parameters": {
+            "population_size": {"type": "number", "min": 50, "max": 500, "default": 100},
+            "generations": {"type": "number", "min": 100, "max": 1000, "default": 200},
+            "mutation_rate": {"type": "number", "min": 0.01, "max": 0.2, "default": 0.05, "step": 0.01},
+            "crossover_rate": {"type": "number", "min": 0.5, "max": 0.95, "default": 0.8, "step": 0.05}
+        }
+    },
+    {
+        "id": "start_optimization",
+        "name": "Start Periodic Optimization",
+        "description": "Start automatic 15-minute optimization cycles",
+        "icon": "mdi:play",
+        "category": "optimization"
+    },
+    {
+        "id": "stop_optimization",
+        "name": "Stop Optimization",
+        "description": "Stop all optimization processes",
+        "icon": "mdi:stop",
+        "category": "optimization"
+    },
+    {
+        "id": "toggle_scheduler",
+        "name": "Toggle Scheduler Mode",
+        "description": "Switch between genetic algorithm and rule-based scheduling",
+        "icon": "mdi:swap-horizontal",
+        "category": "scheduling",
+        "parameters": {
+            "mode": {"type": "select", "options": ["genetic", "rule-based"], "default": "genetic"}
+        }
+    },
+    {
+        "id": "update_pricing",
+        "name": "Update Pricing Parameters",
+        "description": "Modify indexed tariff pricing components",
+        "icon": "mdi:currency-eur",
+        "category": "pricing",
+        "parameters": {
+            "mfrr": {"type": "number", "min": 0, "max": 10, "default": 1.94, "step": 0.01, "unit": "€/MWh"},
+            "q": {"type": "number", "min": 0, "max": 100, "default": 30, "step": 0.1, "unit": "€/MWh"},
+            "fp": {"type": "number", "min": 1, "max": 2, "default": 1.1674, "step": 0.0001},
+            "tae": {"type": "number", "min": 0, "max": 200, "default": 60, "step": 0.1, "unit": "€/MWh"},
+            "vat": {"type": "number", "min": 1, "max": 1.5, "default": 1.23, "step": 0.01},
+            "peak_multiplier": {"type": "number", "min": 1, "max": 2, "default": 1.2, "step": 0.1},
+            "off_peak_multiplier": {"type": "number", "min": 0.5, "max": 1, "default": 0.8, "step": 0.1}
+        }
+    }
+]
+
+_QUICK_ACTIONS = [
+    {"id": "emergency_stop", "name": "Emergency Stop", "icon": "mdi:emergency-stop", "color": "red"},
+    {"id": "quick_optimize", "name": "Quick Optimize", "icon": "mdi:flash", "color": "green"},
+    {"id": "reset_system", "name": "Reset System", "icon": "mdi:restart", "color": "orange"},
+    {"id": "export_data", "name": "Export Data", "icon": "mdi:download", "color": "blue"}
+]
+
+_AVAILABLE_MODES = [
+    {"id": "automatic", "name": "Automatic", "description": "Full genetic algorithm control"},
+    {"id": "manual", "name": "Manual", "description": "User-controlled device scheduling"},
+    {"id": "eco", "name": "Eco Mode", "description": "Maximum energy savings priority"},
+    {"id": "comfort", "name": "Comfort Mode", "description": "User comfort priority"},
+    {"id": "maintenance", "name": "Maintenance", "description": "System maintenance mode"}
+]
+
+_OVERRIDE_TYPES = [
+    {"id": "force_on", "name": "Force Device On", "icon": "mdi:power-on"},
+    {"id": "force_off", "name": "Force Device Off", "icon": "mdi:power-off"},
+    {"id": "schedule_delay", "name": "Delay Schedule", "icon": "mdi:clock-plus"},
+    {"id": "priority_boost", "name": "Priority Boost", "icon": "mdi:arrow-up-bold"}
+]
+
+_EMERGENCY_CONTROLS = {
+    "emergency_stop": {"available": True, "description": "Stop all automated control"},
+    "safe_mode": {"available": True, "description": "Switch to safe manual mode"},
+    "system_reset": {"available": True, "description": "Reset to default settings"},
+    "backup_restore": {"available": True, "description": "Restore from backup"}
+}
+
+# Active-control entry shown while the optimizer is running
+_OPTIMIZATION_ACTIVE_CONTROL = {
+    "id": "optimization_running",
+    "name": "Optimization Active",
+    "type": "status",
+    "icon": "mdi:cog-play",
+    "color": "green"
+}
+
+# Fixed service payloads used by quick actions
+_QUICK_OPTIMIZE_DATA = {"population_size": 50, "generations": 100}
+_EXPORT_DATA = {"format": "json", "include_metadata": True}
+
+# Static frontend layout; shared by every state write, never mutated
+_PANEL_CONFIGURATION = {
+    "layout": "grid",
+    "columns": 3,
+    "theme": "genetic_load_manager",
+    "sections": [
+        {
+            "id": "quick_actions",
+            "name": "Quick Actions",
+            "position": {"row": 1, "col": 1, "span": 1},
+            "type": "button_grid"
+        },
+        {
+            "id": "system_status",
+            "name": "System Status",
+            "position": {"row": 1, "col": 2, "span": 1},
+            "type": "status_display"
+        },
+        {
+            "id": "parameter_controls",
+            "name": "Parameter Controls",
+            "position": {"row": 1, "col": 3, "span": 1},
+            "type": "slider_controls"
+        },
+        {
+            "id": "device_controls",
+            "name": "Device Controls",
+            "position": {"row": 2, "col": 1, "span": 2},
+            "type": "device_grid"
+        },
+        {
+            "id": "schedule_overrides",
+            "name": "Schedule Overrides",
+            "position": {"row": 2, "col": 3, "span": 1},
+            "type": "override_panel"
+        },
+        {
+            "id": "emergency_controls",
+            "name": "Emergency Controls",
+            "position": {"row": 3, "col": 1, "span": 3},
+            "type": "emergency_bar"
+        }
+    ]
+}
+
+_UI_CONFIG = {
+    "color_scheme": {
+        "primary": "#2196F3",
+        "secondary": "#4CAF50",
+        "warning": "#FF9800",
+        "error": "#F44336",
+        "success": "#8BC34A"
+    },
+    "button_styles": {
+        "quick_action": {"size": "large", "style": "filled"},
+        "parameter": {"size": "medium", "style": "outlined"},
+        "emergency": {"size": "large", "style": "filled", "color": "error"}
+    },
+    "animations": {
+        "enabled": True,
+        "duration": "300ms",
+        "easing": "ease-in-out"
+    },
+    "responsive": {
+        "mobile_breakpoint": "768px",
+        "tablet_breakpoint": "1024px"
+    }
+}
+
 
 class ControlPanelSensor(SensorEntity):
     """Control panel sensor for interactive genetic load management."""
 
+    # Only this class's own fields; hass and the _attr_* fields belong to HA
+    __slots__ = (
+        "_state", "_control_state", "_interaction_history", "_scan_interval",
+        "_unsub", "_last_sig", "_last_params_version", "_device_entities",
+        "_dashboard_entity", "_active_controls", "_device_controls",
+        "_active_ids", "_last_change", "_change_intervals", "_refresh_handle"
+    )
+
+    # Keep the per-write lists out of the recorder database
+    _unrecorded_attributes = frozenset({"active_controls", "parameter_controls"})
+    
+    # State is written by async_update only when something changed
+    _attr_should_poll = False
+
     def __init__(self, hass: HomeAssistant, config: dict):
         """Initialize the control panel sensor."""
         self.hass = hass
@@ -26,7 +225,6 @@ class ControlPanelSensor(SensorEntity):
         
         # Control panel state
         self._control_state = {
-            "active_controls": [],
             "available_actions": [],
             "user_preferences": {},
             "quick_actions": [],
@@ -36,111 +234,181 @@ class ControlPanelSensor(SensorEntity):
             "emergency_controls": {}
         }
         
-        # User interaction tracking
-        self._interaction_history = []
+        # User interaction tracking, as (monotonic logged_at, interaction) pairs
+        self._interaction_history = deque(maxlen=_MAX_INTERACTIONS)
+        
+        # Periodic refresh; state-change events are the primary update path
+        self._scan_interval = config.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        self._unsub = None
+        self._refresh_handle = None
+        
+        # Signature of the last written state
+        self._last_sig = None
+        
+        # Optimizer parameter version last copied into parameter_controls
+        self._last_params_version = -1
+        
+        # Entities whose state feeds the panel
+        self._device_entities = tuple(
+            f"switch.device_{device_id}_schedule"
+            for device_id in range(config.get(CONF_NUM_DEVICES, DEFAULT_NUM_DEVICES))
+        )
+        self._dashboard_entity = f"sensor.{DOMAIN}_dashboard"
+        
+        # Active controls keyed by control id, updated in place
+        self._active_controls: Dict[str, Dict[str, Any]] = {}
+        
+        # Observed seconds between active-control changes, for adaptive polling
+        self._active_ids = ()
+        self._last_change = None
+        self._change_intervals = deque(maxlen=_CHANGE_HISTORY)
+        self._device_controls = {
+            device_entity: {
+                "id": f"device_{device_id}_active",
+                "name": f"Device {device_id} Scheduled",
+                "type": "device",
+                "icon": "mdi:power-plug",
+                "color": "blue"
+            }
+            for device_id, device_entity in enumerate(self._device_entities)
+        }
         
     @property
     def state(self):
         """Return number of active controls."""
-        return len(self._control_state["active_controls"])
+        return len(self._active_controls)
 
     @property
     def extra_state_attributes(self):
-        """Return control panel data as attributes."""
+        """Return a compact control panel summary as attributes."""
+        last_action = None
+        if self._interaction_history:
+            _, last = self._interaction_history[-1]
+            last_action = {
+                "action_id": last["action_id"],
+                "success": last["success"],
+                "timestamp": last["timestamp"]
+            }
         return {
-            "control_state": self._control_state,
-            "interaction_history": self._interaction_history[-10:],  # Last 10 interactions
-            "panel_config": self._get_panel_configuration(),
-            "user_interface": self._get_user_interface_config(),
+            "active_controls": list(self._active_controls.values()),
+            "current_mode": self._control_state["system_modes"].get("current_mode"),
+            "parameter_controls": self._control_state["parameter_controls"],
+            "last_action": last_action,
             "last_updated": datetime.now().isoformat()
         }
 
+    def get_panel_definition(self) -> Dict[str, Any]:
+        """Return the full panel definition for the get_control_panel service."""
+        return {
+            "control_state": {
+                **self._control_state,
+                "active_controls": list(self._active_controls.values())
+            },
+            "interaction_history": [  # Last 10 interactions, oldest first
+                interaction for _, interaction in islice(reversed(self._interaction_history), 10)
+            ][::-1],
+            "panel_config": _PANEL_CONFIGURATION,
+            "user_interface": _UI_CONFIG
+        }
+
+    async def async_will_remove_from_hass(self):
+        """Unregister the control panel and cancel the periodic update."""
+        self.hass.data.get(DOMAIN, {}).pop('control_panel', None)
+        if self._unsub:
+            self._unsub.cancel()
+            self._unsub = None
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+
     async def async_added_to_hass(self):
         """Set up the control panel."""
-        async_track_time_interval(self.hass, self.async_update, timedelta(minutes=2))
+        self.hass.data.setdefault(DOMAIN, {})['control_panel'] = self
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass,
+                self._device_entities + (self._dashboard_entity,),
+                self._handle_dependency_change
+            )
+        )
+        self._schedule_update()
         await self._initialize_control_panel()
         await self.async_update()
 
+    @callback
+    def _schedule_update(self):
+        """Schedule the next periodic update."""
+        self._unsub = self.hass.loop.call_later(self._next_poll_delay(), self._handle_update_tick)
+
+    def _next_poll_delay(self) -> float:
+        """Return the next poll delay learned from recent change intervals.
+        
+        Polls at the lower quartile of the observed gaps between changes, so
+        most changes are caught within one tick, clamped between
+        _MIN_POLL_INTERVAL and the configured scan interval.
+        """
+        if not self._change_intervals:
+            return self._scan_interval
+        intervals = sorted(self._change_intervals)
+        delay = intervals[len(intervals) // 4]
+        return min(max(delay, _MIN_POLL_INTERVAL), self._scan_interval)
+
+    def _record_active_change(self):
+        """Remember when the set of active controls last changed."""
+        active_ids = tuple(self._active_controls)
+        if active_ids == self._active_ids:
+            return
+        self._active_ids = active_ids
+        now = time.monotonic()
+        if self._last_change is not None:
+            self._change_intervals.append(now - self._last_change)
+        self._last_change = now
+
+    @callback
+    def _handle_dependency_change(self, event):
+        """Refresh the panel when a tracked device or the dashboard changes."""
+        control = self._device_controls.get(event.data["entity_id"])
+        if control is None:
+            # Dashboard health feeds the mode; run one full update per burst of changes
+            if self._refresh_handle is None:
+                self._refresh_handle = self.hass.loop.call_later(
+                    _REFRESH_DEBOUNCE, self._handle_debounced_refresh
+                )
+            return
+        new_state = event.data.get("new_state")
+        self._set_active(control, new_state is not None and new_state.state == STATE_ON)
+        self._async_write_if_changed()
+
+    @callback
+    def _handle_debounced_refresh(self):
+        """Run the full update for a burst of dashboard changes."""
+        self._refresh_handle = None
+        self.hass.async_create_task(self.async_update())
+
+    @callback
+    def _handle_update_tick(self):
+        """Run the periodic update and schedule the next one."""
+        self.hass.async_create_task(self.async_update())
+        self._schedule_update()
+
     async def _initialize_control_panel(self):
         """Initialize control panel with available controls."""
         try:
             genetic_algo = self.hass.data.get(DOMAIN, {}).get('genetic_algorithm')
             
-            # Initialize available actions
-            self._control_state["available_actions"] = [
-                {
-                    "id": "run_optimization",
-                    "name": "Run Optimization",
-                    "description": "Trigger immediate genetic algorithm optimization",
-                    "icon": "mdi:play-circle",
-                    "category": "optimization",
-                    "parameters": {
-                        "population_size": {"type": "number", "min": 50, "max": 500, "default": 100},
-                        "generations": {"type": "number", "min": 100, "max": 1000, "default": 200},
-                        "mutation_rate": {"type": "number", "min": 0.01, "max": 0.2, "default": 0.05, "step": 0.01},
-                        "crossover_rate": {"type": "number", "min": 0.5, "max": 0.95, "default": 0.8, "step": 0.05}
-                    }
-                },
-                {
-                    "id": "start_optimization",
-                    "name": "Start Periodic Optimization",
-                    "description": "Start automatic 15-minute optimization cycles",
-                    "icon": "mdi:play",
-                    "category": "optimization"
-                },
-                {
-                    "id": "stop_optimization",
-                    "name": "Stop Optimization",
-                    "description": "Stop all optimization processes",
-                    "icon": "mdi:stop",
-                    "category": "optimization"
-                },
-                {
-                    "id": "toggle_scheduler",
-                    "name": "Toggle Scheduler Mode",
-                    "description": "Switch between genetic algorithm and rule-based scheduling",
-                    "icon": "mdi:swap-horizontal",
-                    "category": "scheduling",
-                    "parameters": {
-                        "mode": {"type": "select", "options": ["genetic", "rule-based"], "default": "genetic"}
-                    }
-                },
-                {
-                    "id": "update_pricing",
-                    "name": "Update Pricing Parameters",
-                    "description": "Modify indexed tariff pricing components",
-                    "icon": "mdi:currency-eur",
-                    "category": "pricing",
-                    "parameters": {
-                        "mfrr": {"type": "number", "min": 0, "max": 10, "default": 1.94, "step": 0.01, "unit": "€/MWh"},
-                        "q": {"type": "number", "min": 0, "max": 100, "default": 30, "step": 0.1, "unit": "€/MWh"},
-                        "fp": {"type": "number", "min": 1, "max": 2, "default": 1.1674, "step": 0.0001},
-                        "tae": {"type": "number", "min": 0, "max": 200, "default": 60, "step": 0.1, "unit": "€/MWh"},
-                        "vat": {"type": "number", "min": 1, "max": 1.5, "default": 1.23, "step": 0.01},
-                        "peak_multiplier": {"type": "number", "min": 1, "max": 2, "default": 1.2, "step": 0.1},
-                        "off_peak_multiplier": {"type": "number", "min": 0.5, "max": 1, "default": 0.8, "step": 0.1}
-                    }
-                }
-            ]
-            
-            # Initialize quick actions
-            self._control_state["quick_actions"] = [
-                {"id": "emergency_stop", "name": "Emergency Stop", "icon": "mdi:emergency-stop", "color": "red"},
-                {"id": "quick_optimize", "name": "Quick Optimize", "icon": "mdi:flash", "color": "green"},
-                {"id": "reset_system", "name": "Reset System", "icon": "mdi:restart", "color": "orange"},
-                {"id": "export_data", "name": "Export Data", "icon": "mdi:download", "color": "blue"}
-            ]
+            # Static definitions are shared module constants
+            self._control_state["available_actions"] = _AVAILABLE_ACTIONS
+            self._control_state["quick_actions"] = _QUICK_ACTIONS
+            self._control_state["emergency_controls"] = _EMERGENCY_CONTROLS
             
-            # Initialize system modes
+            # Per-instance state wrapping the shared templates
             self._control_state["system_modes"] = {
                 "current_mode": "automatic",
-                "available_modes": [
-                    {"id": "automatic", "name": "Automatic", "description": "Full genetic algorithm control"},
-                    {"id": "manual", "name": "Manual", "description": "User-controlled device scheduling"},
-                    {"id": "eco", "name": "Eco Mode", "description": "Maximum energy savings priority"},
-                    {"id": "comfort", "name": "Comfort Mode", "description": "User comfort priority"},
-                    {"id": "maintenance", "name": "Maintenance", "description": "System maintenance mode"}
-                ]
+                "available_modes": _AVAILABLE_MODES
+            }
+            self._control_state["schedule_overrides"] = {
+                "active_overrides": [],
+                "override_types": _OVERRIDE_TYPES
             }
             
             # Initialize parameter controls
@@ -164,90 +432,92 @@ class ControlPanelSensor(SensorEntity):
                     }
                 }
             
-            # Initialize schedule overrides
-            self._control_state["schedule_overrides"] = {
-                "active_overrides": [],
-                "override_types": [
-                    {"id": "force_on", "name": "Force Device On", "icon": "mdi:power-on"},
-                    {"id": "force_off", "name": "Force Device Off", "icon": "mdi:power-off"},
-                    {"id": "schedule_delay", "name": "Delay Schedule", "icon": "mdi:clock-plus"},
-                    {"id": "priority_boost", "name": "Priority Boost", "icon": "mdi:arrow-up-bold"}
-                ]
-            }
-            
-            # Initialize emergency controls
-            self._control_state["emergency_controls"] = {
-                "emergency_stop": {"available": True, "description": "Stop all automated control"},
-                "safe_mode": {"available": True, "description": "Switch to safe manual mode"},
-                "system_reset": {"available": True, "description": "Reset to default settings"},
-                "backup_restore": {"available": True, "description": "Restore from backup"}
-            }
-            
             _LOGGER.info("Control panel initialized successfully")
             
         except Exception as e:
-            _LOGGER.error(f"Error initializing control panel: {e}")
+            _LOGGER.error("Error initializing control panel: %s", e)
 
     async def async_update(self, now=None):
-        """Update control panel state."""
+        """Update control panel state in one synchronous pass."""
         try:
-            await self._update_active_controls()
-            await self._update_system_status()
-            await self._cleanup_old_interactions()
+            self._update_active_controls()
+            self._update_system_status()
+            self._cleanup_old_interactions()
             
-            self._state = len(self._control_state["active_controls"])
+            self._state = len(self._active_controls)
+            self._async_write_if_changed()
             
         except Exception as e:
-            _LOGGER.error(f"Error updating control panel: {e}")
+            _LOGGER.error("Error updating control panel: %s", e)
+
+    @callback
+    def _async_write_if_changed(self):
+        """Write the state only if its signature changed."""
+        self._record_active_change()
+        sig = self._state_signature()
+        if sig != self._last_sig:
+            self._last_sig = sig
+            self.async_write_ha_state()
 
-    async def _update_active_controls(self):
-        """Update list of currently active controls."""
+    def _state_signature(self):
+        """Return a hashable summary of everything the written state shows."""
+        control_state = self._control_state
+        return (
+            tuple(self._active_controls),
+            control_state["system_modes"].get("current_mode"),
+            tuple(pc["current"] for pc in control_state["parameter_controls"].values()),
+            self._interaction_history[-1][0] if self._interaction_history else None
+        )
+
+    def _set_active(self, control: Dict[str, Any], active: bool):
+        """Add or remove a control from the active set."""
+        if active:
+            self._active_controls[control["id"]] = control
+        else:
+            self._active_controls.pop(control["id"], None)
+
+    def _update_active_controls(self):
+        """Update the set of currently active controls."""
         try:
-            active_controls = []
-            
             # Check optimization status
             genetic_algo = self.hass.data.get(DOMAIN, {}).get('genetic_algorithm')
-            if genetic_algo and hasattr(genetic_algo, 'is_running') and genetic_algo.is_running:
-                active_controls.append({
-                    "id": "optimization_running",
-                    "name": "Optimization Active",
-                    "type": "status",
-                    "icon": "mdi:cog-play",
-                    "color": "green"
-                })
+            self._set_active(
+                _OPTIMIZATION_ACTIVE_CONTROL,
+                bool(genetic_algo and genetic_algo.is_running)
+            )
             
             # Check device controls
-            for device_id in range(2):  # Assuming 2 devices
-                device_state = self.hass.states.get(f"switch.device_{device_id}_schedule")
-                if device_state and device_state.state == STATE_ON:
-                    active_controls.append({
-                        "id": f"device_{device_id}_active",
-                        "name": f"Device {device_id} Scheduled",
-                        "type": "device",
-                        "icon": "mdi:power-plug",
-                        "color": "blue"
-                    })
+            for device_entity, control in self._device_controls.items():
+                device_state = self.hass.states.get(device_entity)
+                self._set_active(control, device_state is not None and device_state.state == STATE_ON)
             
             # Check for any overrides
+            override_ids = set()
             for override in self._control_state["schedule_overrides"]["active_overrides"]:
-                active_controls.append({
-                    "id": f"override_{override['id']}",
-                    "name": f"Override: {override['name']}",
-                    "type": "override",
-                    "icon": "mdi:hand-back-right",
-                    "color": "orange"
-                })
-            
-            self._control_state["active_controls"] = active_controls
+                control_id = f"override_{override['id']}"
+                override_ids.add(control_id)
+                if control_id not in self._active_controls:
+                    self._active_controls[control_id] = {
+                        "id": control_id,
+                        "name": f"Override: {override['name']}",
+                        "type": "override",
+                        "icon": "mdi:hand-back-right",
+                        "color": "orange"
+                    }
+            for control_id in [
+                control_id for control_id, control in self._active_controls.items()
+                if control["type"] == "override" and control_id not in override_ids
+            ]:
+                del self._active_controls[control_id]
             
         except Exception as e:
-            _LOGGER.error(f"Error updating active controls: {e}")
+            _LOGGER.error("Error updating active controls: %s", e)
 
-    async def _update_system_status(self):
+    def _update_system_status(self):
         """Update overall system status for control panel."""
         try:
             # Get system health
-            dashboard_sensor = self.hass.states.get(f"sensor.{DOMAIN}_dashboard")
+            dashboard_sensor = self.hass.states.get(self._dashboard_entity)
             if dashboard_sensor:
                 dashboard_data = dashboard_sensor.attributes.get('dashboard_data', {})
                 system_health = dashboard_data.get('system_health', {})
@@ -260,97 +530,24 @@ class ControlPanelSensor(SensorEntity):
             
             # Update parameter controls with current values
             genetic_algo = self.hass.data.get(DOMAIN, {}).get('genetic_algorithm')
-            if genetic_algo:
-                for param in self._control_state["parameter_controls"]:
-                    if hasattr(genetic_algo, param):
-                        self._control_state["parameter_controls"][param]["current"] = getattr(genetic_algo, param)
+            if genetic_algo and genetic_algo.params_version != self._last_params_version:
+                self._last_params_version = genetic_algo.params_version
+                for param, control in self._control_state["parameter_controls"].items():
+                    control["current"] = getattr(genetic_algo, param)
             
         except Exception as e:
-            _LOGGER.error(f"Error updating system status: {e}")
+            _LOGGER.error("Error updating system status: %s", e)
 
-    async def _cleanup_old_interactions(self):
+    def _cleanup_old_interactions(self):
         """Clean up old interaction history."""
         try:
             # Keep only interactions from last 24 hours
-            cutoff = datetime.now() - timedelta(hours=24)
-            self._interaction_history = [
-                interaction for interaction in self._interaction_history
-                if datetime.fromisoformat(interaction["timestamp"]) > cutoff
-            ]
+            cutoff = time.monotonic() - _INTERACTION_RETENTION
+            history = self._interaction_history
+            while history and history[0][0] <= cutoff:
+                history.popleft()
         except Exception as e:
-            _LOGGER.error(f"Error cleaning up interactions: {e}")
-
-    def _get_panel_configuration(self):
-        """Get control panel UI configuration."""
-        return {
-            "layout": "grid",
-            "columns": 3,
-            "theme": "genetic_load_manager",
-            "sections": [
-                {
-                    "id": "quick_actions",
-                    "name": "Quick Actions",
-                    "position": {"row": 1, "col": 1, "span": 1},
-                    "type": "button_grid"
-                },
-                {
-                    "id": "system_status",
-                    "name": "System Status",
-                    "position": {"row": 1, "col": 2, "span": 1},
-                    "type": "status_display"
-                },
-                {
-                    "id": "parameter_controls",
-                    "name": "Parameter Controls",
-                    "position": {"row": 1, "col": 3, "span": 1},
-                    "type": "slider_controls"
-                },
-                {
-                    "id": "device_controls",
-                    "name": "Device Controls",
-                    "position": {"row": 2, "col": 1, "span": 2},
-                    "type": "device_grid"
-                },
-                {
-                    "id": "schedule_overrides",
-                    "name": "Schedule Overrides",
-                    "position": {"row": 2, "col": 3, "span": 1},
-                    "type": "override_panel"
-                },
-                {
-                    "id": "emergency_controls",
-                    "name": "Emergency Controls",
-                    "position": {"row": 3, "col": 1, "span": 3},
-                    "type": "emergency_bar"
-                }
-            ]
-        }
-
-    def _get_user_interface_config(self):
-        """Get user interface configuration for frontend."""
-        return {
-            "color_scheme": {
-                "primary": "#2196F3",
-                "secondary": "#4CAF50",
-                "warning": "#FF9800",
-                "error": "#F44336",
-                "success": "#8BC34A"
-            },
-            "button_styles": {
-                "quick_action": {"size": "large", "style": "filled"},
-                "parameter": {"size": "medium", "style": "outlined"},
-                "emergency": {"size": "large", "style": "filled", "color": "error"}
-            },
-            "animations": {
-                "enabled": True,
-                "duration": "300ms",
-                "easing": "ease-in-out"
-            },
-            "responsive": {
-                "mobile_breakpoint": "768px",
-                "tablet_breakpoint": "1024px"
-            }
-        }
+            _LOGGER.error("Error cleaning up interactions: %s", e)
 
     async def log_user_interaction(self, action_id: str, parameters: Dict[str, Any] = None, user_id: str = None):
         """Log user interaction with control panel."""
@@ -364,175 +561,136 @@ class ControlPanelSensor(SensorEntity):
                 "response_time": 0  # Will be updated when action completes
             }
             
-            self._interaction_history.append(interaction)
-            _LOGGER.info(f"User interaction logged: {action_id}")
+            self._interaction_history.append((time.monotonic(), interaction))
+            _LOGGER.info("User interaction logged: %s", action_id)
             
         except Exception as e:
-            _LOGGER.error(f"Error logging user interaction: {e}")
+            _LOGGER.error("Error logging user interaction: %s", e)
 
     async def execute_control_action(self, action_id: str, parameters: Dict[str, Any] = None):
         """Execute a control panel action."""
+        handler = self._ACTIONS.get(action_id)
+        if handler is None:
+            _LOGGER.warning("Unknown control action: %s", action_id)
+            return False
+        
         try:
-            start_time = datetime.now()
+            start = time.monotonic()
             
             # Log the interaction
             await self.log_user_interaction(action_id, parameters)
             
             # Execute the action
-            success = False
-            if action_id == "run_optimization":
-                success = await self._execute_run_optimization(parameters or {})
-            elif action_id == "start_optimization":
-                success = await self._execute_start_optimization()
-            elif action_id == "stop_optimization":
-                success = await self._execute_stop_optimization()
-            elif action_id == "toggle_scheduler":
-                success = await self._execute_toggle_scheduler(parameters or {})
-            elif action_id == "update_pricing":
-                success = await self._execute_update_pricing(parameters or {})
-            elif action_id == "emergency_stop":
-                success = await self._execute_emergency_stop()
-            elif action_id == "quick_optimize":
-                success = await self._execute_quick_optimize()
-            elif action_id == "reset_system":
-                success = await self._execute_reset_system()
-            elif action_id == "export_data":
-                success = await self._execute_export_data()
-            else:
-                _LOGGER.warning(f"Unknown control action: {action_id}")
-                return False
+            success = await handler(self, parameters or {})
             
             # Update interaction history with result
             if self._interaction_history:
-                self._interaction_history[-1]["success"] = success
-                self._interaction_history[-1]["response_time"] = (datetime.now() - start_time).total_seconds()
+                _, interaction = self._interaction_history[-1]
+                interaction["success"] = success
+                interaction["response_time"] = time.monotonic() - start
             
             return success
             
         except Exception as e:
-            _LOGGER.error(f"Error executing control action {action_id}: {e}")
+            _LOGGER.error("Error executing control action %s: %s", action_id, e)
             return False
 
     async def _execute_run_optimization(self, parameters: Dict[str, Any]) -> bool:
         """Execute run optimization action."""
-        try:
-            service_data = {}
-            for param, value in parameters.items():
-                if param in ['population_size', 'generations', 'mutation_rate', 'crossover_rate']:
-                    service_data[param] = value
-            
-            await self.hass.services.async_call(
-                DOMAIN, "run_optimization", service_data
-            )
-            return True
-        except Exception as e:
-            _LOGGER.error(f"Error running optimization: {e}")
-            return False
+        service_data = {}
+        for param, value in parameters.items():
+            if param in ['population_size', 'generations', 'mutation_rate', 'crossover_rate']:
+                service_data[param] = value
+        
+        await self.hass.services.async_call(
+            DOMAIN, "run_optimization", service_data
+        )
+        return True
 
-    async def _execute_start_optimization(self) -> bool:
+    async def _execute_start_optimization(self, parameters: Dict[str, Any]) -> bool:
         """Execute start optimization action."""
-        try:
-            await self.hass.services.async_call(DOMAIN, "start_optimization", {})
-            return True
-        except Exception as e:
-            _LOGGER.error(f"Error starting optimization: {e}")
-            return False
+        await self.hass.services.async_call(DOMAIN, "start_optimization", {})
+        return True
 
-    async def _execute_stop_optimization(self) -> bool:
+    async def _execute_stop_optimization(self, parameters: Dict[str, Any]) -> bool:
         """Execute stop optimization action."""
-        try:
-            await self.hass.services.async_call(DOMAIN, "stop_optimization", {})
-            return True
-        except Exception as e:
-            _LOGGER.error(f"Error stopping optimization: {e}")
-            return False
+        await self.hass.services.async_call(DOMAIN, "stop_optimization", {})
+        return True
 
     async def _execute_toggle_scheduler(self, parameters: Dict[str, Any]) -> bool:
         """Execute toggle scheduler action."""
-        try:
-            mode = parameters.get('mode', 'genetic')
-            await self.hass.services.async_call(
-                DOMAIN, "toggle_scheduler", {"mode": mode}
-            )
-            return True
-        except Exception as e:
-            _LOGGER.error(f"Error toggling scheduler: {e}")
-            return False
+        mode = parameters.get('mode', 'genetic')
+        await self.hass.services.async_call(
+            DOMAIN, "toggle_scheduler", {"mode": mode}
+        )
+        return True
 
     async def _execute_update_pricing(self, parameters: Dict[str, Any]) -> bool:
         """Execute update pricing action."""
-        try:
-            await self.hass.services.async_call(
-                DOMAIN, "update_pricing_parameters", parameters
-            )
-            return True
-        except Exception as e:
-            _LOGGER.error(f"Error updating pricing: {e}")
-            return False
+        await self.hass.services.async_call(
+            DOMAIN, "update_pricing_parameters", parameters
+        )
+        return True
 
-    async def _execute_emergency_stop(self) -> bool:
+    async def _execute_emergency_stop(self, parameters: Dict[str, Any]) -> bool:
         """Execute emergency stop action."""
-        try:
-            # Stop optimization
-            await self.hass.services.async_call(DOMAIN, "stop_optimization", {})
-            
-            # Turn off all scheduled devices
-            for device_id in range(2):
-                device_entity = f"switch.device_{device_id}_schedule"
-                if self.hass.states.get(device_entity):
-                    await self.hass.services.async_call(
-                        "switch", "turn_off", {"entity_id": device_entity}
-                    )
-            
-            _LOGGER.warning("Emergency stop executed - all optimization stopped")
-            return True
-        except Exception as e:
-            _LOGGER.error(f"Error executing emergency stop: {e}")
-            return False
-
-    async def _execute_quick_optimize(self) -> bool:
-        """Execute quick optimization with default parameters."""
-        try:
+        # Stop optimization
+        await self.hass.services.async_call(DOMAIN, "stop_optimization", {})
+        
+        # Turn off all scheduled devices in one call
+        existing = [
+            device_entity for device_entity in self._device_entities
+            if self.hass.states.get(device_entity)
+        ]
+        if existing:
             await self.hass.services.async_call(
-                DOMAIN, "run_optimization", 
-                {"population_size": 50, "generations": 100}
+                "switch", "turn_off", {"entity_id": existing}
             )
-            return True
-        except Exception as e:
-            _LOGGER.error(f"Error executing quick optimize: {e}")
-            return False
+        
+        _LOGGER.warning("Emergency stop executed - all optimization stopped")
+        return True
+
+    async def _execute_quick_optimize(self, parameters: Dict[str, Any]) -> bool:
+        """Execute quick optimization with default parameters."""
+        await self.hass.services.async_call(
+            DOMAIN, "run_optimization", _QUICK_OPTIMIZE_DATA
+        )
+        return True
 
-    async def _execute_reset_system(self) -> bool:
+    async def _execute_reset_system(self, parameters: Dict[str, Any]) -> bool:
         """Execute system reset action."""
-        try:
-            # Stop optimization
-            await self.hass.services.async_call(DOMAIN, "stop_optimization", {})
-            
-            # Reset to default parameters
-            genetic_algo = self.hass.data.get(DOMAIN, {}).get('genetic_algorithm')
-            if genetic_algo:
-                genetic_algo.population_size = 100
-                genetic_algo.generations = 200
-                genetic_algo.mutation_rate = 0.05
-                genetic_algo.crossover_rate = 0.8
-            
-            _LOGGER.info("System reset executed")
-            return True
-        except Exception as e:
-            _LOGGER.error(f"Error executing system reset: {e}")
-            return False
+        # Stop optimization
+        await self.hass.services.async_call(DOMAIN, "stop_optimization", {})
+        
+        # Reset to default parameters
+        genetic_algo = self.hass.data.get(DOMAIN, {}).get('genetic_algorithm')
+        if genetic_algo:
+            genetic_algo.set_parameters(
+                population_size=100, generations=200, mutation_rate=0.05, crossover_rate=0.8
+            )
+        
+        _LOGGER.info("System reset executed")
+        return True
 
-    async def _execute_export_data(self) -> bool:
+    async def _execute_export_data(self, parameters: Dict[str, Any]) -> bool:
         """Execute data export action."""
-        try:
-            await self.hass.services.async_call(
-                DOMAIN, "export_schedule", {"format": "json", "include_metadata": True}
-            )
-            return True
-        except Exception as e:
-            _LOGGER.error(f"Error executing data export: {e}")
-            return False
+        await self.hass.services.async_call(
+            DOMAIN, "export_schedule", _EXPORT_DATA
+        )
+        return True
 
+    # Action id -> handler; every handler takes the (possibly empty) parameters
+    _ACTIONS = {
+        "run_optimization": _execute_run_optimization,
+        "start_optimization": _execute_start_optimization,
+        "stop_optimization": _execute_stop_optimization,
+        "toggle_scheduler": _execute_toggle_scheduler,
+        "update_pricing": _execute_update_pricing,
+        "emergency_stop": _execute_emergency_stop,
+        "quick_optimize": _execute_quick_optimize,
+        "reset_system": _execute_reset_system,
+        "export_data": _execute_export_data,
+    }
 
 async def async_setup_control_panel_sensors(hass: HomeAssistant, entry: ConfigType, async_add_entities: AddEntitiesCallback):
     """Set up control panel sensors."""
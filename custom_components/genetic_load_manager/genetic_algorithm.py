@@ -1,7 +1,8 @@
 import random
 import math
 from datetime import datetime, timedelta
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_time_interval
 import logging
 from .const import (
@@ -9,13 +10,77 @@ from .const import (
     CONF_PV_FORECAST_TOMORROW, CONF_LOAD_FORECAST, CONF_BATTERY_SOC, CONF_GRID_POWER,
     CONF_DEMAND_RESPONSE, CONF_CARBON_INTENSITY, CONF_WEATHER, CONF_EV_CHARGER,
     CONF_SMART_THERMOSTAT, CONF_SMART_PLUG, CONF_LIGHTING, CONF_MEDIA_PLAYER,
-    DEFAULT_OPTIMIZATION_MODE, DEFAULT_UPDATE_INTERVAL, DEFAULT_ENTITIES
+    DEFAULT_OPTIMIZATION_MODE, DEFAULT_UPDATE_INTERVAL, DEFAULT_ENTITIES,
+    SIGNAL_OPTIMIZER_UPDATED, MAX_CACHE_SIZE
 )
 from .pricing_calculator import IndexedTariffCalculator
 import asyncio
+from bisect import bisect_right
+from collections import Counter
+from types import MappingProxyType
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maps the ASCII digits of a binary string onto 0/1 gene bytes
+_BIT_GENES = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _unpack_bits(bits, width):
+    """Spread the low `width` bits of an int into a bytearray of 0/1 genes."""
+    return bytearray(format(bits, f"0{width}b"), "ascii").translate(_BIT_GENES)
+
+
+def _sample_slots(rate, width, rand=random.random):
+    """Yield each slot in range(width) independently with probability `rate`.
+    
+    Skips ahead by geometrically distributed gaps, so it draws about
+    rate * width random numbers instead of one per slot.
+    """
+    if rate <= 0:
+        return
+    if rate >= 1:
+        yield from range(width)
+        return
+    log_keep = math.log(1.0 - rate)
+    t = -1
+    while True:
+        t += int(math.log(1.0 - rand()) / log_keep) + 1
+        if t >= width:
+            return
+        yield t
+
+def _build_load_extension_profile():
+    """Return typical household load (kW) per hour of day, in four 15-minute steps."""
+    profile = []
+    for hour in range(24):
+        if 6 <= hour <= 9:  # Morning peak
+            base, step = 0.8, 0.1  # 0.8 to 1.1 kW
+        elif 17 <= hour <= 22:  # Evening peak
+            base, step = 1.5, 0.2  # 1.5 to 2.3 kW
+        elif 23 <= hour or hour <= 5:  # Night
+            base, step = 0.2, 0.05  # 0.2 to 0.35 kW
+        else:  # Daytime
+            base, step = 0.4, 0.1  # 0.4 to 0.7 kW
+        profile.append(tuple(round(base + q * step, 2) for q in range(4)))
+    return tuple(profile)
+
+
+# Per-hour, per-quarter values used to pad short load forecasts
+_LOAD_EXTENSION_PROFILE = _build_load_extension_profile()
+
+# Generations without a meaningful fitness gain after which a run stops early
+_STALL_GENERATIONS = 20
+
+# Smallest gain over the last counted best that resets the stall counter
+_MIN_IMPROVEMENT = 1e-6
+
+# Hourly household load (kW) used when no usable load history exists
+_REALISTIC_DAILY_PATTERN = (
+    0.8, 1.2, 1.5, 1.8, 2.0, 1.8, 1.5, 1.2, 0.8, 0.6, 0.5, 0.4,
+    0.4, 0.3, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.4, 0.3, 0.3, 0.4,
+)
+
+
 class GeneticLoadOptimizer:
     def __init__(self, hass: HomeAssistant, config: dict):
         """Initialize the genetic algorithm optimizer."""
@@ -49,6 +114,8 @@ class GeneticLoadOptimizer:
         self.time_slots = 96
         self.pv_forecast = None
         self.load_forecast = None
+        self.battery_soc = None
+        self.population = None
         self.battery_capacity = config.get("battery_capacity", 10.0)
         self.max_charge_rate = config.get("max_charge_rate", 2.0)
         self.max_discharge_rate = config.get("max_discharge_rate", 2.0)
@@ -75,12 +142,23 @@ class GeneticLoadOptimizer:
         self.best_fitness = float("-inf")
         self.best_solution = None
         self.current_generation = 0
+        # Serialises optimize() so overlapping requests never publish interleaved results
+        self._optimize_lock = asyncio.Lock()
+        # Private generator so the executor-side GA never shares the module-level random state
+        self._rng = random.Random()
         self._async_unsub_track_time = None  # Track the time interval unsub function
+        
+        # Status snapshot shared read-only with entities
+        self.params_version = 0
+        self._refresh_parameters()
+        self._refresh_status()
 
     async def fetch_forecast_data(self):
         """Fetch and process Solcast PV, load, battery, and pricing data for a 24-hour horizon."""
         _LOGGER.info("=== Starting forecast data fetch ===")
-        current_time = datetime.now().replace(second=0, microsecond=0)
+        # Read the clock once; slot filtering and interpolation share this instant
+        fetch_time = datetime.now()
+        current_time = fetch_time.replace(second=0, microsecond=0)
         # Make current_time timezone-aware to match Solcast data
         try:
             from datetime import timezone
@@ -92,6 +170,9 @@ class GeneticLoadOptimizer:
             current_time = current_time.replace(tzinfo=None)
             _LOGGER.debug(f"Using timezone-naive current_time: {current_time}")
             
+        # One state machine handle for every input entity read this cycle
+        states = self.hass.states
+        
         slot_duration = timedelta(minutes=15)
         forecast_horizon = timedelta(hours=24)
         end_time = current_time + forecast_horizon
@@ -107,9 +188,7 @@ class GeneticLoadOptimizer:
         
         if self.pv_forecast_today_entity:
             try:
-                pv_today_state = await self.hass.async_add_executor_job(
-                    self.hass.states.get, self.pv_forecast_today_entity
-                )
+                pv_today_state = states.get(self.pv_forecast_today_entity)
                 if not pv_today_state:
                     _LOGGER.error(f"PV forecast entity not found: {self.pv_forecast_today_entity}")
                     _LOGGER.error("This entity may not exist or may be misconfigured")
@@ -126,9 +205,7 @@ class GeneticLoadOptimizer:
             
         if self.pv_forecast_tomorrow_entity:
             try:
-                pv_tomorrow_state = await self.hass.async_add_executor_job(
-                    self.hass.states.get, self.pv_forecast_tomorrow_entity
-                )
+                pv_tomorrow_state = states.get(self.pv_forecast_tomorrow_entity)
                 if not pv_tomorrow_state:
                     _LOGGER.error(f"PV tomorrow forecast entity not found: {self.pv_forecast_tomorrow_entity}")
                     _LOGGER.error("This entity may not exist or may be misconfigured")
@@ -191,9 +268,14 @@ class GeneticLoadOptimizer:
             _LOGGER.error("Check entity configuration and data availability")
             self.pv_forecast = pv_forecast
         else:
-            # Combine forecasts
+            # Combine forecasts; times are kept as epoch seconds so filtering, sorting
+            # and interpolation never allocate timedeltas
             times = []
             values = []
+            now_ts = current_time.timestamp()
+            naive_now_ts = current_time.replace(tzinfo=None).timestamp()
+            # Per-item outcomes are counted and logged once after the loop
+            skipped = 0
             
             _LOGGER.info(f"Processing PV forecasts - Today: {len(pv_today_raw)} items, Tomorrow: {len(pv_tomorrow_raw)} items")
             
@@ -211,39 +293,41 @@ class GeneticLoadOptimizer:
                             period_start = item["period_start"]
                             pv_estimate = item["pv_estimate"]
                             
-                            _LOGGER.debug(f"Processing item {i}: period_start={period_start}, pv_estimate={pv_estimate}")
-                            
                             # Parse the period_start string (handle timezone info)
                             try:
-                                period_time = datetime.fromisoformat(period_start)
+                                if isinstance(period_start, datetime):
+                                    # Solcast stores datetimes in its attributes; no parsing needed
+                                    period_time = period_start
+                                else:
+                                    if isinstance(period_start, str) and period_start.endswith("Z"):
+                                        # fromisoformat only accepts "Z" from Python 3.11
+                                        period_start = period_start[:-1] + "+00:00"
+                                    period_time = datetime.fromisoformat(period_start)
                                 pv_value = float(pv_estimate)
                                 
                                 # Handle timezone comparison - make both timezone-aware
                                 if period_time.tzinfo is None:
                                     # If period_time is timezone-naive, assume it's in local time (+01:00)
                                     period_time = period_time.replace(tzinfo=timezone(timedelta(hours=1)))
-                                    _LOGGER.debug(f"Made period_time timezone-aware: {period_time}")
-                                
-                                if current_time.tzinfo is None:
-                                    # If current_time is timezone-naive, make it timezone-aware
-                                    current_time = current_time.replace(tzinfo=period_time.tzinfo)
-                                    _LOGGER.debug(f"Made current_time timezone-aware: {current_time}")
                                 
                                 # For PV forecasts, include all data for the next 48 hours regardless of current time
                                 # This ensures we get both today and tomorrow's data even if it's currently night
-                                time_diff = period_time - current_time
-                                hours_ahead = time_diff.total_seconds() / 3600
+                                period_ts = period_time.timestamp()
+                                hours_ahead = (period_ts - now_ts) / 3600
                                 
                                 # Include data up to 48 hours in the future
                                 if hours_ahead >= -2 and hours_ahead <= 48:  # Allow 2 hours in the past for safety
-                                    times.append(period_time)
+                                    times.append(period_ts)
                                     values.append(pv_value)
-                                    _LOGGER.debug(f"Added forecast: {period_time} -> {pv_value} kW (hours ahead: {hours_ahead:.1f})")
                                 else:
-                                    _LOGGER.debug(f"Skipping time: {period_time} (hours ahead: {hours_ahead:.1f})")
+                                    skipped += 1
                                     
                             except ValueError as e:
                                 _LOGGER.warning(f"Could not parse time '{period_start}' for item {i}: {e}")
+                                # Only a string timestamp has another spelling to try; a datetime
+                                # item got here through a bad estimate, so skip just this item
+                                if not isinstance(period_start, str):
+                                    continue
                                 # Try alternative timezone handling
                                 try:
                                     # Remove timezone info and try parsing
@@ -251,22 +335,16 @@ class GeneticLoadOptimizer:
                                     period_time = datetime.fromisoformat(clean_time)
                                     pv_value = float(pv_estimate)
                                     
-                                    # Make both timezone-naive for comparison
-                                    if current_time.tzinfo is not None:
-                                        current_time_naive = current_time.replace(tzinfo=None)
-                                    else:
-                                        current_time_naive = current_time
-                                    
-                                    time_diff = period_time - current_time_naive
-                                    hours_ahead = time_diff.total_seconds() / 3600
+                                    # Compare as timezone-naive wall-clock times
+                                    period_ts = period_time.timestamp()
+                                    hours_ahead = (period_ts - naive_now_ts) / 3600
                                     
                                     # Include data up to 48 hours in the future
                                     if hours_ahead >= -2 and hours_ahead <= 48:
-                                        times.append(period_time)
+                                        times.append(period_ts)
                                         values.append(pv_value)
-                                        _LOGGER.debug(f"Added forecast (clean time): {period_time} -> {pv_value} kW (hours ahead: {hours_ahead:.1f})")
                                     else:
-                                        _LOGGER.debug(f"Skipping time (clean): {period_time} (hours ahead: {hours_ahead:.1f})")
+                                        skipped += 1
                                 except ValueError as e2:
                                     _LOGGER.warning(f"Could not parse clean time '{clean_time}' for item {i}: {e2}")
                                     continue
@@ -281,8 +359,9 @@ class GeneticLoadOptimizer:
                         continue
 
             _LOGGER.info(f"Total parsed forecast points: {len(times)}")
+            _LOGGER.debug("Skipped %d forecast points outside the 48 hour window", skipped)
             if times:
-                _LOGGER.debug(f"Time range: {min(times)} to {max(times)}")
+                _LOGGER.debug(f"Time range: {datetime.fromtimestamp(min(times))} to {datetime.fromtimestamp(max(times))}")
                 _LOGGER.debug(f"Value range: {min(values)} to {max(values)} kW")
             else:
                 _LOGGER.error("No forecast times were parsed - this indicates a problem with the time filtering logic")
@@ -292,15 +371,15 @@ class GeneticLoadOptimizer:
 
             if times:
                 # Sort by time to ensure chronological order
-                sorted_pairs = sorted(zip(times, values), key=lambda x: x[0])
+                sorted_pairs = sorted(zip(times, values))
                 times, values = zip(*sorted_pairs)
                 times = list(times)
                 values = list(values)
 
-                _LOGGER.info(f"Successfully parsed {len(times)} PV forecast data points from {times[0]} to {times[-1]}")
+                _LOGGER.info(f"Successfully parsed {len(times)} PV forecast data points from {datetime.fromtimestamp(times[0])} to {datetime.fromtimestamp(times[-1])}")
                 
                 # Create the final forecast array
-                self.pv_forecast = self._interpolate_forecast(times, values)
+                self.pv_forecast = self._interpolate_forecast(times, values, fetch_time.timestamp())
                 _LOGGER.info(f"PV forecast set from interpolation: {len(self.pv_forecast)} slots, max: {max(self.pv_forecast):.3f} kW")
             else:
                 _LOGGER.error("No valid forecast times found, using fallback zero forecast")
@@ -312,9 +391,7 @@ class GeneticLoadOptimizer:
         _LOGGER.info(f"Fetching load forecast from entity: {self.load_forecast_entity}")
         if self.load_forecast_entity:
             try:
-                load_state = await self.hass.async_add_executor_job(
-                    self.hass.states.get, self.load_forecast_entity
-                )
+                load_state = states.get(self.load_forecast_entity)
                 if load_state and load_state.state not in ['unknown', 'unavailable']:
                     try:
                         forecast_data = load_state.attributes.get("forecast", None)
@@ -322,32 +399,31 @@ class GeneticLoadOptimizer:
                         _LOGGER.debug(f"Sample data: {forecast_data[:5] if forecast_data else 'None'}")
                         
                         if forecast_data and isinstance(forecast_data, list) and len(forecast_data) > 0:
-                            # Use provided forecast data
-                            self.load_forecast = [float(x) for x in forecast_data]
-                            if len(self.load_forecast) != self.time_slots:
-                                _LOGGER.warning(f"Load forecast size mismatch: got {len(self.load_forecast)}, expected {self.time_slots}")
+                            # Use provided forecast data, converting only the slots that are kept
+                            self.load_forecast = list(map(float, forecast_data[:self.time_slots]))
+                            if len(forecast_data) != self.time_slots:
+                                _LOGGER.warning(f"Load forecast size mismatch: got {len(forecast_data)}, expected {self.time_slots}")
                                 # Resize to match time slots
                                 if len(self.load_forecast) < self.time_slots:
                                     extension_values = self._get_realistic_load_extension(len(self.load_forecast), self.time_slots)
                                     self.load_forecast.extend(extension_values)
                                     _LOGGER.info(f"Extended forecast to {len(self.load_forecast)} slots with realistic values")
-                                elif len(self.load_forecast) > self.time_slots:
-                                    self.load_forecast = self.load_forecast[:self.time_slots]
+                                else:
                                     _LOGGER.info(f"Truncated forecast to {len(self.load_forecast)} slots")
                             _LOGGER.info(f"Successfully loaded load forecast: {len(self.load_forecast)} slots")
                         else:
                             _LOGGER.warning("No valid forecast data found, generating smart forecast from historical data")
-                            self.load_forecast = await self._generate_smart_load_forecast()
+                            self.load_forecast = await self._generate_smart_load_forecast(load_state)
                     except (ValueError, TypeError) as e:
                         _LOGGER.error(f"Error parsing load forecast data: {e}")
                         _LOGGER.error(f"Raw forecast data: {forecast_data}")
                         _LOGGER.warning("Generating smart forecast due to parsing error")
-                        self.load_forecast = await self._generate_smart_load_forecast()
+                        self.load_forecast = await self._generate_smart_load_forecast(load_state)
                 else:
                     _LOGGER.error(f"Load forecast entity unavailable: {self.load_forecast_entity}")
                     _LOGGER.error(f"Entity state: {load_state.state if load_state else 'None'}")
                     _LOGGER.warning("Generating smart forecast due to entity unavailability")
-                    self.load_forecast = await self._generate_smart_load_forecast()
+                    self.load_forecast = await self._generate_smart_load_forecast(load_state)
             except Exception as e:
                 _LOGGER.error(f"Exception while fetching load forecast: {e}")
                 _LOGGER.error(f"Exception type: {type(e).__name__}")
@@ -362,9 +438,7 @@ class GeneticLoadOptimizer:
         _LOGGER.info(f"Fetching battery SOC from entity: {self.battery_soc_entity}")
         if self.battery_soc_entity:
             try:
-                battery_state = await self.hass.async_add_executor_job(
-                    self.hass.states.get, self.battery_soc_entity
-                )
+                battery_state = states.get(self.battery_soc_entity)
                 if battery_state and battery_state.state not in ['unknown', 'unavailable']:
                     try:
                         self.battery_soc = float(battery_state.state)
@@ -423,12 +497,9 @@ class GeneticLoadOptimizer:
                 _LOGGER.debug(f"Market prices type: {type(market_prices)}")
                 
                 if isinstance(market_prices, list) and len(market_prices) == 24:
-                    # Convert 24 hourly prices to 96 time slots (15-minute intervals)
-                    self.pricing = []
-                    for hour_price in market_prices:
-                        # Repeat the hourly price for 4 time slots (15-minute intervals)
-                        for _ in range(4):
-                            self.pricing.append(float(hour_price))
+                    # Convert 24 hourly prices to 96 time slots (15-minute intervals),
+                    # converting each hourly price once and repeating it for 4 slots
+                    self.pricing = [price for price in map(float, market_prices) for _ in range(4)]
                     _LOGGER.info("Using market price entity with 96 time slots")
                     _LOGGER.debug(f"Pricing range: {min(self.pricing):.4f} to {max(self.pricing):.4f} €/kWh")
                 else:
@@ -443,7 +514,7 @@ class GeneticLoadOptimizer:
                 self.pricing = [0.1] * self.time_slots
         
         # Ensure pricing is initialized even if both methods fail
-        if not hasattr(self, 'pricing') or self.pricing is None or len(self.pricing) != self.time_slots:
+        if self.pricing is None or len(self.pricing) != self.time_slots:
             _LOGGER.error("Both indexed and dynamic pricing failed, using default pricing")
             _LOGGER.error("This will result in uniform pricing across all time slots")
             self.pricing = [0.1] * self.time_slots  # Default 0.1 €/kWh
@@ -463,39 +534,45 @@ class GeneticLoadOptimizer:
         # Note: self.pv_forecast is already set correctly above from interpolation or fallback
         _LOGGER.debug(f"PV forecast (96 slots): {self.pv_forecast}")
         
-        # Final validation: Ensure PV forecast was not overwritten and contains valid data
-        if not hasattr(self, 'pv_forecast') or self.pv_forecast is None:
+        # Final validation: Ensure PV forecast was not overwritten and contains valid data.
+        # Every branch but the last leaves an all-zero forecast, so pv_max stays 0.0.
+        pv_max = 0.0
+        if self.pv_forecast is None:
             _LOGGER.error("CRITICAL ERROR: PV forecast is None after processing!")
             self.pv_forecast = [0.0] * self.time_slots
         elif len(self.pv_forecast) != self.time_slots:
             _LOGGER.error(f"CRITICAL ERROR: PV forecast size mismatch: {len(self.pv_forecast)} != {self.time_slots}")
             self.pv_forecast = [0.0] * self.time_slots
-        elif all(x == 0.0 for x in self.pv_forecast):
+        elif not any(self.pv_forecast):
             _LOGGER.warning("PV forecast contains all zeros - this may indicate a data processing issue")
         else:
-            _LOGGER.info(f"PV forecast validation passed: {len(self.pv_forecast)} slots, max: {max(self.pv_forecast):.3f} kW")
+            pv_max = max(self.pv_forecast)
+            _LOGGER.info(f"PV forecast validation passed: {len(self.pv_forecast)} slots, max: {pv_max:.3f} kW")
+        
+        # Each summary statistic is reduced once and shared by the log lines below
+        load_max = max(self.load_forecast)
+        price_min = min(self.pricing)
+        price_max = max(self.pricing)
         
         _LOGGER.info("=== Forecast data fetch completed ===")
-        _LOGGER.info(f"PV forecast: {len(self.pv_forecast)} slots, max: {max(self.pv_forecast):.3f} kW")
-        _LOGGER.info(f"Load forecast: {len(self.load_forecast)} slots, max: {max(self.load_forecast):.3f} kW")
+        _LOGGER.info(f"PV forecast: {len(self.pv_forecast)} slots, max: {pv_max:.3f} kW")
+        _LOGGER.info(f"Load forecast: {len(self.load_forecast)} slots, max: {load_max:.3f} kW")
         _LOGGER.info(f"Battery SOC: {self.battery_soc:.1f}%")
-        _LOGGER.info(f"Pricing: {len(self.pricing)} slots, range: {min(self.pricing):.4f}-{max(self.pricing):.4f} €/kWh")
+        _LOGGER.info(f"Pricing: {len(self.pricing)} slots, range: {price_min:.4f}-{price_max:.4f} €/kWh")
 
     async def initialize_population(self):
         # Initialize population with random values
-        self.population = []
-        for _ in range(self.population_size):
-            device_schedule = []
-            for _ in range(self.num_devices):
-                time_schedule = [random.uniform(0, 1) for _ in range(self.time_slots)]
-                device_schedule.append(time_schedule)
-            self.population.append(device_schedule)
-        for i in range(self.population_size):
-            for d in range(self.num_devices):
-                if self.binary_control:
-                    # Convert to binary (0 or 1)
-                    for t in range(self.time_slots):
-                        self.population[i][d][t] = 1.0 if self.population[i][d][t] > 0.5 else 0.0
+        if self.binary_control:
+            # On/off genomes are stored one byte per slot, each row unpacked from a single random word
+            self.population = [
+                [_unpack_bits(self._rng.getrandbits(self.time_slots), self.time_slots) for _ in range(self.num_devices)]
+                for _ in range(self.population_size)
+            ]
+        else:
+            self.population = [
+                [[self._rng.random() for _ in range(self.time_slots)] for _ in range(self.num_devices)]
+                for _ in range(self.population_size)
+            ]
 
     async def fitness_function(self, chromosome):
         try:
@@ -525,8 +602,8 @@ class GeneticLoadOptimizer:
                 return -1000.0
             
             for d, device_schedule in enumerate(chromosome):
-                if not isinstance(device_schedule, list) or len(device_schedule) != self.time_slots:
-                    _LOGGER.error(f"Invalid device {d} schedule: expected {self.time_slots} time slots, got {len(device_schedule) if isinstance(device_schedule, list) else 'not a list'}")
+                if not isinstance(device_schedule, (list, bytearray)) or len(device_schedule) != self.time_slots:
+                    _LOGGER.error(f"Invalid device {d} schedule: expected {self.time_slots} time slots, got {len(device_schedule) if isinstance(device_schedule, (list, bytearray)) else 'not a list'}")
                     return -1000.0
                 
                 # Validate numeric values
@@ -541,7 +618,7 @@ class GeneticLoadOptimizer:
             solar_utilization = 0.0
             battery_penalty = 0.0
             priority_penalty = 0.0
-            battery_soc = self.battery_soc if hasattr(self, 'battery_soc') and self.battery_soc is not None else 0.0
+            battery_soc = self.battery_soc if self.battery_soc is not None else 0.0
             
             _LOGGER.debug(f"Starting fitness calculation with battery SOC: {battery_soc}%")
             
@@ -630,7 +707,16 @@ class GeneticLoadOptimizer:
             return -1000.0  # Heavy penalty for errors
 
     async def optimize(self):
-        """Run the genetic algorithm optimization."""
+        """Run the genetic algorithm optimization.
+        
+        Service calls and the periodic task may both request a run; a second caller
+        waits for the first to finish rather than overlapping with it.
+        """
+        async with self._optimize_lock:
+            return await self._async_optimize()
+
+    async def _async_optimize(self):
+        """Fetch data, evolve the population and publish the result of one run."""
         _LOGGER.info("=== Starting genetic algorithm optimization ===")
         
         try:
@@ -647,18 +733,31 @@ class GeneticLoadOptimizer:
             _LOGGER.info("Initializing population...")
             await self.initialize_population()
             
-            if not hasattr(self, 'population') or not self.population:
+            if not self.population:
                 _LOGGER.error("Population initialization failed")
                 return None
             
             _LOGGER.info(f"Population initialized: {len(self.population)} individuals, {self.num_devices} devices, {self.time_slots} time slots")
             
-            # Run CPU-intensive optimization in executor to prevent blocking
+            # Run CPU-intensive optimization in executor to prevent blocking. The worker
+            # gets the population, fitness inputs and parameters as arguments, so a
+            # parameter update during the run does not reach it; results are published
+            # back on the event loop.
             _LOGGER.info("Starting genetic algorithm execution...")
-            best_solution = await self.hass.async_add_executor_job(
-                self._run_genetic_optimization
+            result = await self.hass.async_add_executor_job(
+                self._run_genetic_optimization,
+                self.population,
+                self._prepare_fitness_inputs(),
+                self.generations,
+                self.mutation_rate,
+                self.crossover_rate,
             )
             
+            best_solution = None
+            if result is not None:
+                best_solution, self.best_fitness, self.population = result
+                self.best_solution = best_solution
+            
             if best_solution is not None:
                 _LOGGER.info("Optimization completed successfully")
                 _LOGGER.info(f"Best fitness: {self.best_fitness:.4f}")
@@ -674,6 +773,8 @@ class GeneticLoadOptimizer:
             import traceback
             _LOGGER.error(f"Traceback: {traceback.format_exc()}")
             return None
+        finally:
+            self._async_notify_update()
 
     def _validate_optimization_data(self):
         """Validate that all required data is available for optimization."""
@@ -714,7 +815,7 @@ class GeneticLoadOptimizer:
                 return False
             
             # Check battery SOC
-            if not hasattr(self, 'battery_soc') or self.battery_soc is None:
+            if self.battery_soc is None:
                 _LOGGER.error("Battery SOC is None")
                 return False
             if not isinstance(self.battery_soc, (int, float)) or not math.isfinite(self.battery_soc):
@@ -722,7 +823,7 @@ class GeneticLoadOptimizer:
                 return False
             
             # Check device priorities
-            if not hasattr(self, 'device_priorities') or not self.device_priorities:
+            if not self.device_priorities:
                 _LOGGER.error("Device priorities not initialized")
                 return False
             if len(self.device_priorities) < self.num_devices:
@@ -737,83 +838,101 @@ class GeneticLoadOptimizer:
             _LOGGER.error(f"Exception type: {type(e).__name__}")
             return False
 
-    def _run_genetic_optimization(self):
-        """Run the genetic algorithm optimization in executor thread."""
+    def _run_genetic_optimization(self, population, fitness_inputs, generations, mutation_rate, crossover_rate):
+        """Run the genetic algorithm optimization in executor thread.
+        
+        Works only on its arguments and the fixed device layout, and returns
+        (best_solution, best_fitness, final_population) or None on failure.
+        """
         _LOGGER.info("=== Starting genetic algorithm execution ===")
         
         try:
             best_solution = None
             best_fitness = float("-inf")
             
-            _LOGGER.info(f"Optimization parameters: {self.population_size} individuals, {self.generations} generations")
-            _LOGGER.info(f"Mutation rate: {self.mutation_rate}, Crossover rate: {self.crossover_rate}")
+            _LOGGER.info(f"Optimization parameters: {len(population)} individuals, {generations} generations")
+            _LOGGER.info(f"Mutation rate: {mutation_rate}, Crossover rate: {crossover_rate}")
             
-            for generation in range(self.generations):
-                try:
-                    # Calculate fitness scores synchronously in executor
-                    _LOGGER.debug(f"Generation {generation}: Calculating fitness scores...")
+            # Bind the per-generation callables once; attribute lookups dominate the inner loops
+            evaluate = self._fitness_function_sync
+            select = self._select_parents_sync
+            crossover = self._crossover_sync
+            mutate = self._mutate_sync
+            
+            # Binary genomes recur as the population converges; the fitness inputs are
+            # fixed for the run, so scores can be reused until the next run
+            fitness_cache = {} if self.binary_control else None
+            stalled_generations = 0
+            # Fitness at the last gain that counted; creeping float noise does not
+            # keep a converged run alive
+            stall_baseline = best_fitness
+            
+            # Failures surface through the handler around the whole run rather than
+            # per individual or generation; nothing in this numeric loop raises on valid input
+            size = len(population)
+            for generation in range(generations):
+                # Calculate fitness scores synchronously in executor. Log calls in this
+                # loop use lazy %-arguments so nothing is formatted unless emitted.
+                _LOGGER.debug("Generation %d: Calculating fitness scores...", generation)
+                if fitness_cache is None:
+                    fitness_scores = [evaluate(individual, fitness_inputs) for individual in population]
+                else:
                     fitness_scores = []
-                    
-                    for i, individual in enumerate(self.population):
-                        try:
-                            fitness = self._fitness_function_sync(individual)
-                            fitness_scores.append(fitness)
-                        except Exception as e:
-                            _LOGGER.error(f"Error calculating fitness for individual {i}: {e}")
-                            fitness_scores.append(-1000.0)  # Heavy penalty for errors
-                    
-                    if not fitness_scores:
-                        _LOGGER.error("No fitness scores calculated, aborting optimization")
-                        break
-                    
-                    # Find best fitness for this generation
-                    max_fitness = max(fitness_scores)
-                    if max_fitness > best_fitness:
-                        best_fitness = max_fitness
-                        best_idx = fitness_scores.index(max_fitness)
-                        best_solution = [row[:] for row in self.population[best_idx]]
-                        _LOGGER.info(f"Generation {generation}: New best fitness = {best_fitness:.4f}")
-                    
-                    # Create new population
-                    _LOGGER.debug(f"Generation {generation}: Creating new population...")
-                    new_population = []
-                    
-                    for _ in range(self.population_size // 2):
-                        try:
-                            parent1 = self._tournament_selection_sync(fitness_scores)
-                            parent2 = self._tournament_selection_sync(fitness_scores)
-                            child1, child2 = self._crossover_sync(parent1, parent2)
-                            child1 = self._mutate_sync(child1, generation)
-                            child2 = self._mutate_sync(child2, generation)
-                            new_population.extend([child1, child2])
-                        except Exception as e:
-                            _LOGGER.error(f"Error creating offspring in generation {generation}: {e}")
-                            # Add parents as fallback
-                            new_population.extend([parent1, parent2])
-                    
-                    if new_population:
-                        self.population = new_population
-                    else:
-                        _LOGGER.error(f"Failed to create new population for generation {generation}")
+                    for individual in population:
+                        key = b"".join(individual)
+                        fitness = fitness_cache.get(key)
+                        if fitness is None:
+                            if len(fitness_cache) >= MAX_CACHE_SIZE:
+                                fitness_cache.clear()
+                            fitness = fitness_cache[key] = evaluate(individual, fitness_inputs)
+                        fitness_scores.append(fitness)
+                
+                # Find best fitness for this generation
+                max_fitness = max(fitness_scores)
+                best_idx = fitness_scores.index(max_fitness)
+                if max_fitness > best_fitness:
+                    best_fitness = max_fitness
+                    # Individuals are never modified once created, so no copy is needed
+                    best_solution = population[best_idx]
+                    _LOGGER.info("Generation %d: New best fitness = %.4f", generation, best_fitness)
+                if best_fitness - stall_baseline > _MIN_IMPROVEMENT:
+                    stall_baseline = best_fitness
+                    stalled_generations = 0
+                else:
+                    stalled_generations += 1
+                    if stalled_generations >= _STALL_GENERATIONS:
+                        _LOGGER.info("Generation %d: No improvement for %d generations, stopping early", generation, stalled_generations)
                         break
-                    
-                    # Log progress every 50 generations
-                    if generation % 50 == 0:
-                        _LOGGER.info(f"Generation {generation}: Best fitness = {best_fitness:.4f}, Population size = {len(self.population)}")
-                    
-                except Exception as e:
-                    _LOGGER.error(f"Error in generation {generation}: {e}")
-                    _LOGGER.error(f"Exception type: {type(e).__name__}")
-                    continue
-            
-            self.best_fitness = best_fitness
-            self.best_solution = best_solution
+                
+                # Create new population, carrying the generation's best individual over
+                # unchanged (children are always fresh copies, so it can be shared)
+                _LOGGER.debug("Generation %d: Creating new population...", generation)
+                new_population = [None] * size
+                new_population[0] = population[best_idx]
+                
+                # Mutation anneals linearly over the run
+                rate = mutation_rate * (1 - generation / generations)
+                
+                # Every tournament of the generation is drawn up front; consecutive
+                # winners pair up as parents
+                parents = iter(select(population, fitness_scores, 2 * (size // 2)))
+                for i, (parent1, parent2) in zip(range(1, size, 2), zip(parents, parents)):
+                    child1, child2 = crossover(parent1, parent2, crossover_rate)
+                    new_population[i] = mutate(child1, rate)
+                    if i + 1 < size:
+                        new_population[i + 1] = mutate(child2, rate)
+                
+                population = new_population
+                
+                # Log progress every 50 generations
+                if generation % 50 == 0:
+                    _LOGGER.info("Generation %d: Best fitness = %.4f, Population size = %d", generation, best_fitness, len(population))
             
             _LOGGER.info("=== Genetic algorithm execution completed ===")
             _LOGGER.info(f"Final best fitness: {best_fitness:.4f}")
             _LOGGER.info(f"Best solution available: {best_solution is not None}")
             
-            return best_solution
+            return best_solution, best_fitness, population
             
         except Exception as e:
             _LOGGER.error(f"Unexpected error in genetic algorithm execution: {e}")
@@ -822,113 +941,115 @@ class GeneticLoadOptimizer:
             _LOGGER.error(f"Traceback: {traceback.format_exc()}")
             return None
 
-    def _fitness_function_sync(self, chromosome):
+    def _prepare_fitness_inputs(self):
+        """Return the per-slot (load, pv, price) inputs, zipped once per optimization run."""
+        if self.pricing is not None:
+            prices = [price / 1000.0 for price in self.pricing]
+        else:
+            prices = [0.1] * self.time_slots  # Fallback price
+        return tuple(zip(self.load_forecast, self.pv_forecast, prices))
+
+    def _fitness_function_sync(self, chromosome, fitness_inputs):
         """Synchronous version of fitness function for executor."""
         # This is the CPU-intensive calculation moved to executor thread
         cost = 0.0
         solar_utilization = 0.0
         battery_usage = 0.0
         
-        for t in range(self.time_slots):
-            device_consumption = sum(chromosome[d][t] for d in range(len(chromosome)))
-            net_load = self.load_forecast[t] + device_consumption - self.pv_forecast[t]
-            
-            if hasattr(self, 'pricing') and self.pricing is not None:
-                cost += net_load * self.pricing[t] / 1000.0
-            else:
-                cost += net_load * 0.1  # Fallback price
-            
-            solar_utilization += min(self.pv_forecast[t], self.load_forecast[t] + device_consumption)
-            battery_usage += abs(net_load) * 0.1
+        # Column sums give the consumption of all devices per time slot in one pass
+        for device_consumption, (load, pv, price) in zip(map(sum, zip(*chromosome)), fitness_inputs):
+            demand = load + device_consumption
+            net_load = demand - pv
+            cost += net_load * price
+            solar_utilization += pv if pv < demand else demand
+            battery_usage += abs(net_load)
         
-        fitness = -(cost + battery_usage * 0.01) + solar_utilization * 0.02
+        fitness = -(cost + battery_usage * 0.1 * 0.01) + solar_utilization * 0.02
         return fitness
 
-    def _tournament_selection_sync(self, fitness_scores):
-        """Synchronous tournament selection for executor."""
+    def _select_parents_sync(self, population, fitness_scores, count):
+        """Run count tournaments in one pass and return the winners in draw order."""
         tournament_size = 5
-        selection = random.sample(range(self.population_size), tournament_size)
-        best_idx = selection[[fitness_scores[i] for i in selection].index(max([fitness_scores[i] for i in selection]))]
-        return self.population[best_idx]
+        sample = self._rng.sample
+        indices = range(len(population))
+        score = fitness_scores.__getitem__
+        return [population[max(sample(indices, tournament_size), key=score)] for _ in range(count)]
 
-    def _crossover_sync(self, parent1, parent2):
+    def _crossover_sync(self, parent1, parent2, crossover_rate):
         """Synchronous crossover for executor."""
-        if random.random() < self.crossover_rate:
-            point = random.randint(1, self.time_slots - 1)
-            # Swap the time segments after the crossover point
-            for d in range(len(parent1)):
-                parent1[d][point:], parent2[d][point:] = parent2[d][point:][:], parent1[d][point:][:]
-        # Deep copy the parents
-        parent1_copy = [[val for val in device] for device in parent1]
-        parent2_copy = [[val for val in device] for device in parent2]
-        return parent1_copy, parent2_copy
+        if self._rng.random() < crossover_rate:
+            point = self._rng.randint(1, self.time_slots - 1)
+            # Build children from the parents' time segments; parents may be selected
+            # again this generation, so they are never modified in place
+            child1 = [head[:point] + tail[point:] for head, tail in zip(parent1, parent2)]
+            child2 = [head[:point] + tail[point:] for head, tail in zip(parent2, parent1)]
+            return child1, child2
+        # Copy the parents
+        return [row[:] for row in parent1], [row[:] for row in parent2]
 
-    def _mutate_sync(self, chromosome, generation):
+    def _mutate_sync(self, chromosome, adaptive_rate):
         """Synchronous mutation for executor."""
-        adaptive_rate = self.mutation_rate * (1 - generation / self.generations)
-        # Apply mutation to random positions
-        for d in range(len(chromosome)):
-            for t in range(len(chromosome[d])):
-                if random.random() < adaptive_rate:
-                    chromosome[d][t] = random.random()
         if self.binary_control:
-            # Convert to binary (0 or 1)
-            for d in range(len(chromosome)):
-                for t in range(len(chromosome[d])):
-                    chromosome[d][t] = 1.0 if chromosome[d][t] > 0.5 else 0.0
+            # Redraw the selected bits of each packed row with a single XOR
+            width = self.time_slots
+            for row in chromosome:
+                selected = 0
+                for t in _sample_slots(adaptive_rate, width, self._rng.random):
+                    selected |= 1 << (width - 1 - t)
+                if selected:
+                    flips = int.from_bytes(_unpack_bits(selected & self._rng.getrandbits(width), width), "big")
+                    row[:] = (int.from_bytes(row, "big") ^ flips).to_bytes(width, "big")
+            return chromosome
+        # Apply mutation to random positions
+        rand = self._rng.random
+        for row in chromosome:
+            for t in _sample_slots(adaptive_rate, len(row), rand):
+                row[t] = rand()
         return chromosome
 
-    def _interpolate_forecast(self, times, values):
-        """Interpolate forecast data to 15-minute time slots."""
-        from datetime import timedelta
+    def _interpolate_forecast(self, times, values, start=None):
+        """Interpolate forecast data to 15-minute time slots starting at epoch `start`.
         
+        `times` are sorted epoch seconds matching `values`.
+        """
         if not times or not values:
             _LOGGER.warning("No times or values provided for interpolation")
             return [0.0] * self.time_slots
         
-        # Create 15-minute slot duration
-        slot_duration = timedelta(minutes=15)
-        current_time = datetime.now()
+        if start is None:
+            start = datetime.now().timestamp()
         
         # Initialize forecast array with zeros
         pv_forecast = [0.0] * self.time_slots
         
         _LOGGER.debug(f"Interpolating {len(times)} data points to {self.time_slots} time slots")
-        _LOGGER.debug(f"Time range: {times[0]} to {times[-1]}")
-        _LOGGER.debug(f"Current time: {current_time}")
         
-        # Interpolate to 15-minute slots
+        # Interpolate to 15-minute slots; times are sorted, so the bracketing
+        # pair is found by binary search
+        last = len(times) - 1
         for t in range(self.time_slots):
-            slot_time = current_time + t * slot_duration
-            
-            if slot_time < times[0] or slot_time >= times[-1]:
-                pv_forecast[t] = 0.0
+            slot_time = start + t * 900.0
+            i = bisect_right(times, slot_time) - 1
+            if i < 0 or i >= last:
                 continue
-                
-            # Find bracketing times for interpolation
-            for i in range(len(times) - 1):
-                if times[i] <= slot_time < times[i + 1]:
-                    # Linear interpolation
-                    time_diff = (times[i + 1] - times[i]).total_seconds()
-                    slot_diff = (slot_time - times[i]).total_seconds()
-                    weight = slot_diff / time_diff
-                    pv_forecast[t] = values[i] * (1 - weight) + values[i + 1] * weight
-                    break
+            # Linear interpolation
+            weight = (slot_time - times[i]) / (times[i + 1] - times[i])
+            pv_forecast[t] = values[i] * (1 - weight) + values[i + 1] * weight
         
         _LOGGER.info(f"Generated PV forecast with {len(pv_forecast)} slots, max value: {max(pv_forecast):.3f} kW")
         return pv_forecast
 
     async def tournament_selection(self, fitness_scores):
         tournament_size = 5
-        selection = random.sample(range(self.population_size), tournament_size)
+        selection = self._rng.sample(range(self.population_size), tournament_size)
         # Use pre-calculated fitness scores instead of recalculating
         tournament_fitness = [fitness_scores[i] for i in selection]
         best_idx = selection[tournament_fitness.index(max(tournament_fitness))]
         return self.population[best_idx]
 
     async def crossover(self, parent1, parent2):
-        if random.random() < self.crossover_rate:
-            point = random.randint(1, self.time_slots - 1)
+        if self._rng.random() < self.crossover_rate:
+            point = self._rng.randint(1, self.time_slots - 1)
             # Create children by combining parent schedules
             child1 = []
             child2 = []
@@ -948,11 +1069,11 @@ class GeneticLoadOptimizer:
         # Apply mutation to random positions
         for d in range(len(chromosome)):
             for t in range(len(chromosome[d])):
-                if random.random() < adaptive_rate:
+                if self._rng.random() < adaptive_rate:
                     if self.binary_control:
                         chromosome[d][t] = 1 - chromosome[d][t]
                     else:
-                        chromosome[d][t] = random.uniform(0, 1)
+                        chromosome[d][t] = self._rng.uniform(0, 1)
         return chromosome
 
     async def schedule_optimization(self):
@@ -962,13 +1083,13 @@ class GeneticLoadOptimizer:
             
             try:
                 # Check if genetic algorithm is properly initialized
-                if not hasattr(self, 'population') or not self.population:
+                if not self.population:
                     _LOGGER.error("Genetic algorithm not properly initialized")
                     _LOGGER.error("Attempting to reinitialize...")
                     
                     try:
                         await self.initialize_population()
-                        if not hasattr(self, 'population') or not self.population:
+                        if not self.population:
                             _LOGGER.error("Failed to reinitialize population")
                             return
                         _LOGGER.info("Population reinitialized successfully")
@@ -990,14 +1111,15 @@ class GeneticLoadOptimizer:
                         try:
                             if d < len(solution):
                                 device_schedule = solution[d]
-                                if isinstance(device_schedule, list) and len(device_schedule) > 0:
+                                if isinstance(device_schedule, (list, bytearray)) and len(device_schedule) > 0:
                                     # Use proper Home Assistant state setting method
                                     entity_id = f"switch.device_{d}_schedule"
                                     state = "on" if device_schedule[0] > 0.5 else "off"
                                     
-                                    # Convert schedule to list if it's a numpy array
-                                    if hasattr(device_schedule, 'tolist'):
-                                        schedule_list = device_schedule.tolist()
+                                    # Bytearray rows become plain 0/1 lists for the state attributes;
+                                    # list rows are never modified once created, so they are used as-is
+                                    if isinstance(device_schedule, list):
+                                        schedule_list = device_schedule
                                     else:
                                         schedule_list = list(device_schedule)
                                     
@@ -1058,6 +1180,7 @@ class GeneticLoadOptimizer:
                 try:
                     await self.fetch_forecast_data()
                     await self.initialize_population()
+                    self._async_notify_update()
                     _LOGGER.info("Recovery successful")
                 except Exception as recovery_error:
                     _LOGGER.error(f"Recovery failed: {recovery_error}")
@@ -1089,12 +1212,13 @@ class GeneticLoadOptimizer:
     @property
     def is_running(self):
         """Check if the genetic algorithm is currently running."""
-        return hasattr(self, 'population') and self.population is not None
+        return self.population is not None
 
     async def start(self):
         """Start the genetic algorithm optimizer."""
         await self.fetch_forecast_data()
         await self.initialize_population()
+        self._async_notify_update()
         return True
 
     async def stop(self):
@@ -1103,8 +1227,55 @@ class GeneticLoadOptimizer:
         if self._async_unsub_track_time:
             self._async_unsub_track_time()
             self._async_unsub_track_time = None
+        self._async_notify_update()
         return True
 
+    @callback
+    def set_parameters(self, **parameters):
+        """Update tunable algorithm parameters."""
+        for key, value in parameters.items():
+            if key not in ("population_size", "generations", "mutation_rate", "crossover_rate"):
+                raise ValueError(f"Unknown algorithm parameter: {key}")
+            setattr(self, key, value)
+        self.params_version += 1
+        self._refresh_parameters()
+        # Entities are push-only, so publish the new projection right away
+        self._async_notify_update()
+
+    def _refresh_parameters(self):
+        """Rebuild the parameter projection exposed to entities."""
+        self._parameters = MappingProxyType({
+            "population_size": self.population_size,
+            "generations": self.generations,
+            "num_devices": self.num_devices
+        })
+
+    def get_status(self):
+        """Return a read-only view of the latest status snapshot."""
+        return MappingProxyType(self._status)
+
+    def _refresh_status(self):
+        """Rebuild the status snapshot shared by all entities."""
+        self._status = {
+            "is_running": self.is_running,
+            "pv_forecast_available": self.pv_forecast is not None,
+            "load_forecast_available": self.load_forecast is not None,
+            "parameters": self._parameters,
+            "num_devices": self.num_devices,
+            "device_priorities": self.device_priorities,
+            "battery_capacity": self.battery_capacity,
+            "pv_forecast_entity": self.pv_forecast_today_entity,
+            "load_forecast_entity": self.load_forecast_entity,
+            "battery_soc_entity": self.battery_soc_entity,
+            "dynamic_pricing_entity": self.dynamic_pricing_entity,
+        }
+
+    @callback
+    def _async_notify_update(self):
+        """Push the current optimizer status to listening entities."""
+        self._refresh_status()
+        async_dispatcher_send(self.hass, SIGNAL_OPTIMIZER_UPDATED, self.get_status())
+
     async def run_optimization(self):
         """Run a single optimization cycle."""
         return await self.optimize()
@@ -1112,33 +1283,37 @@ class GeneticLoadOptimizer:
     async def rule_based_schedule(self):
         """Generate a rule-based schedule as fallback."""
         # Ensure forecast data is available
-        if not hasattr(self, 'pv_forecast') or self.pv_forecast is None:
+        if self.pv_forecast is None:
             await self.fetch_forecast_data()
         
         # Simple rule-based scheduling based on PV forecast and pricing
-        schedule = [[0.0 for _ in range(self.time_slots)] for _ in range(self.num_devices)]
+        slot_row = [0.0] * self.time_slots
         
         # Safety check for forecast data
-        if hasattr(self, 'pv_forecast') and hasattr(self, 'pricing') and self.pv_forecast is not None and self.pricing is not None:
-            for t in range(self.time_slots):
-                # Turn on devices when PV generation is high and prices are low
-                if self.pv_forecast[t] > 0.5 and self.pricing[t] < sum(self.pricing) / len(self.pricing):
-                    for d in range(self.num_devices):
-                        schedule[d][t] = 1.0
+        if self.pv_forecast is not None and self.pricing is not None:
+            avg_price = sum(self.pricing) / len(self.pricing)
+            # Turn on devices when PV generation is high and prices are low
+            slot_row = [
+                1.0 if pv > 0.5 and price < avg_price else 0.0
+                for pv, price in zip(self.pv_forecast, self.pricing)
+            ]
         
-        return schedule
+        # Every device follows the same rule, so each gets a copy of one slot row
+        return [slot_row[:] for _ in range(self.num_devices)]
 
-    async def _generate_smart_load_forecast(self):
-        """Generates a smart load forecast based on historical data and daily patterns."""
+    async def _generate_smart_load_forecast(self, load_state=None):
+        """Generates a smart load forecast based on historical data and daily patterns.
+        
+        Callers that already hold the load forecast state pass it in to avoid a second lookup.
+        """
         _LOGGER.info("Generating smart load forecast...")
         smart_forecast = []
         
         # Fetch historical load data from the load_forecast_entity
         if self.load_forecast_entity:
             try:
-                load_state = await self.hass.async_add_executor_job(
-                    self.hass.states.get, self.load_forecast_entity
-                )
+                if load_state is None:
+                    load_state = self.hass.states.get(self.load_forecast_entity)
                 if load_state and load_state.state not in ['unknown', 'unavailable']:
                     try:
                         historical_data = load_state.attributes.get("forecast", [])
@@ -1146,16 +1321,15 @@ class GeneticLoadOptimizer:
                         _LOGGER.debug(f"Sample data: {historical_data[:5] if historical_data else 'None'}")
                         
                         if historical_data and isinstance(historical_data, list) and len(historical_data) > 0:
-                            # Use provided historical data
-                            smart_forecast = [float(x) for x in historical_data]
-                            if len(smart_forecast) != self.time_slots:
-                                _LOGGER.warning(f"Historical load forecast size mismatch: got {len(smart_forecast)}, expected {self.time_slots}")
+                            # Use provided historical data, converting only the slots that are kept
+                            smart_forecast = list(map(float, historical_data[:self.time_slots]))
+                            if len(historical_data) != self.time_slots:
+                                _LOGGER.warning(f"Historical load forecast size mismatch: got {len(historical_data)}, expected {self.time_slots}")
                                 # Resize to match time slots
                                 if len(smart_forecast) < self.time_slots:
                                     smart_forecast.extend([0.1] * (self.time_slots - len(smart_forecast)))
                                     _LOGGER.info(f"Extended historical forecast to {len(smart_forecast)} slots")
-                                elif len(smart_forecast) > self.time_slots:
-                                    smart_forecast = smart_forecast[:self.time_slots]
+                                else:
                                     _LOGGER.info(f"Truncated historical forecast to {len(smart_forecast)} slots")
                             _LOGGER.info(f"Successfully loaded historical load forecast: {len(smart_forecast)} slots")
                         else:
@@ -1200,23 +1374,10 @@ class GeneticLoadOptimizer:
         # Each slot is 15 minutes, so we can determine the hour
         start_hour = (current_length // 4) % 24
         
-        extension_values = []
-        for i in range(extension_length):
-            hour = (start_hour + (i // 4)) % 24
-            
-            # Generate realistic values based on time of day
-            if 6 <= hour <= 9:  # Morning peak
-                value = 0.8 + (i % 4) * 0.1  # 0.8 to 1.1 kW
-            elif 17 <= hour <= 22:  # Evening peak
-                value = 1.5 + (i % 4) * 0.2  # 1.5 to 2.3 kW
-            elif 23 <= hour or hour <= 5:  # Night
-                value = 0.2 + (i % 4) * 0.05  # 0.2 to 0.35 kW
-            else:  # Daytime
-                value = 0.4 + (i % 4) * 0.1  # 0.4 to 0.7 kW
-            
-            extension_values.append(round(value, 2))
-        
-        return extension_values
+        return [
+            _LOAD_EXTENSION_PROFILE[(start_hour + i // 4) % 24][i % 4]
+            for i in range(extension_length)
+        ]
 
     def _generate_daily_pattern(self, historical_data):
         """Generates a daily pattern from historical load data."""
@@ -1224,14 +1385,11 @@ class GeneticLoadOptimizer:
             _LOGGER.warning("Not enough historical data to generate a daily pattern.")
             return self._generate_realistic_daily_pattern()
 
-        # Extract daily load patterns from historical data
-        daily_loads = []
-        for i in range(24):
-            daily_load = sum(historical_data[j] for j in range(i, len(historical_data), 24))
-            daily_loads.append(daily_load)
+        # Extract daily load patterns from historical data; a stride-24 slice
+        # gathers every reading for an hour of day in one C-level copy
+        daily_loads = [sum(historical_data[i::24]) for i in range(24)]
 
         # Find the most common daily load pattern
-        from collections import Counter
         pattern_counts = Counter(daily_loads)
         most_common_pattern = pattern_counts.most_common(1)[0][0]
 
@@ -1243,41 +1401,8 @@ class GeneticLoadOptimizer:
 
     def _generate_realistic_daily_pattern(self):
         """Generates a realistic daily load pattern based on typical household usage."""
-        _LOGGER.info("Generating realistic daily load pattern...")
-        
-        # Create a realistic daily load pattern (24 hourly values)
-        # Based on typical household energy usage patterns
-        
-        # Morning peak (6-9 AM): cooking, showers, heating
-        morning_peak = [0.8, 1.2, 1.5, 1.8, 2.0, 1.8, 1.5, 1.2, 0.8, 0.6, 0.5, 0.4]
-        
-        # Daytime (9 AM - 5 PM): lower usage, some appliances
-        daytime = [0.4, 0.3, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8]
-        daytime.extend([0.4, 0.3, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8])
-        daytime.extend([0.4, 0.3, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8])
-        daytime.extend([0.4, 0.3, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8])
-        
-        # Evening peak (5-10 PM): cooking, lighting, entertainment, heating
-        evening_peak = [1.0, 1.5, 2.0, 2.5, 3.0, 2.8, 2.5, 2.0, 1.8, 1.5, 1.2, 1.0, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.3, 0.3]
-        
-        # Night (10 PM - 6 AM): minimal usage, some standby devices
-        night = [0.3, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2]
-        
-        # Combine all patterns
-        daily_pattern = morning_peak + daytime + evening_peak + night
-        
-        # Ensure we have exactly 24 hours
-        if len(daily_pattern) != 24:
-            _LOGGER.warning(f"Daily pattern length mismatch: {len(daily_pattern)} != 24")
-            # Pad or truncate to 24 hours
-            if len(daily_pattern) < 24:
-                daily_pattern.extend([0.3] * (24 - len(daily_pattern)))
-            else:
-                daily_pattern = daily_pattern[:24]
-        
+        daily_pattern = list(_REALISTIC_DAILY_PATTERN)
         _LOGGER.info(f"Generated realistic daily pattern: {len(daily_pattern)} hours, total: {sum(daily_pattern):.2f} kWh")
-        _LOGGER.debug(f"Pattern range: {min(daily_pattern):.2f} - {max(daily_pattern):.2f} kW")
-        
         return daily_pattern
 
     def _log_event(self, level, message):
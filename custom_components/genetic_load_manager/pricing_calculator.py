@@ -71,9 +71,7 @@ class IndexedTariffCalculator:
         # Fetch market price data
         if self.market_price_entity:
             try:
-                state = await self.hass.async_add_executor_job(
-                    self.hass.states.get, self.market_price_entity
-                )
+                state = self.hass.states.get(self.market_price_entity)
                 
                 if not state:
                     _LOGGER.error(f"Market price entity not found: {self.market_price_entity}")